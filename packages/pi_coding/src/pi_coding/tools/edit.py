@@ -105,11 +105,22 @@ async def _execute_edit(
                 details={"error": "text_not_found", "path": absolute_path},
             )
 
-        fuzzy_content = normalize_for_fuzzy_match(normalized_content)
-        fuzzy_old_text = normalize_for_fuzzy_match(normalized_old_text)
-        occurrences = fuzzy_content.count(fuzzy_old_text)
-
-        if occurrences > 1:
+        # A fuzzy match has already normalized both sides, so reuse that work
+        if match_result.used_fuzzy_match:
+            fuzzy_content = match_result.content_for_replacement
+            fuzzy_old_text = fuzzy_content[
+                match_result.index : match_result.index + match_result.match_length
+            ]
+        else:
+            fuzzy_content = normalize_for_fuzzy_match(normalized_content)
+            fuzzy_old_text = normalize_for_fuzzy_match(normalized_old_text)
+        # A second non-overlapping match settles uniqueness without scanning
+        # the whole file; the full count is only needed for the error message
+        first = fuzzy_content.find(fuzzy_old_text)
+        second = fuzzy_content.find(fuzzy_old_text, first + max(len(fuzzy_old_text), 1))
+
+        if second != -1:
+            occurrences = fuzzy_content.count(fuzzy_old_text)
             return AgentToolResult(
                 content=[
                     TextContent(
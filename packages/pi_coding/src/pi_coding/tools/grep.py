@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import os
 import shutil
+from collections import OrderedDict
+from itertools import groupby
+from operator import itemgetter
 from pi_agent.types import AgentToolUpdateCallback
 from typing import Any
 
@@ -22,6 +26,88 @@ from pi_coding.utils import (
 )
 
 DEFAULT_LIMIT = 100
+# Bytes of rg --json output read per await
+_READ_CHUNK_SIZE = 64 * 1024
+# Seconds to wait for rg to exit on SIGTERM before falling back to SIGKILL
+_TERMINATE_TIMEOUT = 0.1
+
+
+class _FileLineCache:
+    """
+    LRU cache of file lines shared across grep calls.
+
+    Entries are revalidated against the file's mtime and size on every lookup,
+    and the cache is bounded both by file count and by total characters so a
+    single huge file cannot evict everything else (files over the character
+    budget are returned but never cached).
+    """
+
+    def __init__(self, max_files: int = 256, max_chars: int = 64 * 1024 * 1024) -> None:
+        self._max_files = max_files
+        self._max_chars = max_chars
+        self._entries: OrderedDict[str, tuple[int, int, int, list[str]]] = OrderedDict()
+        self._chars = 0
+
+    def get(self, file_path: str) -> list[str]:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return []
+
+        entry = self._entries.get(file_path)
+        if entry is not None:
+            mtime_ns, size, _, lines = entry
+            if mtime_ns == st.st_mtime_ns and size == st.st_size:
+                self._entries.move_to_end(file_path)
+                return lines
+            self._remove(file_path)
+
+        try:
+            # Text mode already translates "\r\n" and "\r" to "\n"; splitlines()
+            # is avoided because it also breaks on "\f", "\x85", "\u2028"...,
+            # which would drift from ripgrep's line numbers.
+            with open(file_path, encoding="utf-8", errors="replace") as f:
+                content = f.read()
+        except Exception:
+            return []
+
+        lines = content.split("\n")
+        chars = len(content)
+        if chars <= self._max_chars:
+            self._entries[file_path] = (st.st_mtime_ns, st.st_size, chars, lines)
+            self._chars += chars
+            while len(self._entries) > self._max_files or self._chars > self._max_chars:
+                self._remove(next(iter(self._entries)))
+        return lines
+
+    def _remove(self, file_path: str) -> None:
+        _, _, chars, _ = self._entries.pop(file_path)
+        self._chars -= chars
+
+
+_FILE_LINE_CACHE = _FileLineCache()
+
+
+async def _stop_process(process: asyncio.subprocess.Process) -> None:
+    """
+    Stop rg once we have read enough: ask it to exit with SIGTERM and only
+    SIGKILL it if it has not exited within _TERMINATE_TIMEOUT seconds.
+    """
+    with contextlib.suppress(ProcessLookupError):
+        process.terminate()
+    try:
+        await asyncio.wait_for(process.wait(), timeout=_TERMINATE_TIMEOUT)
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on, honoring affinity masks set by containers."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
 
 _GREP_TOOL_PARAMETERS = {
     "type": "object",
@@ -99,8 +185,14 @@ async def _execute_grep(
     context_value = max(0, context) if context else 0
     effective_limit = max(1, limit)
 
+    # rg prefixes every result with the search path exactly as it was passed,
+    # so a prefix strip covers the common case without os.path.relpath
+    search_prefix = search_path.rstrip(os.sep) + os.sep
+
     def format_path(file_path: str) -> str:
         if is_directory:
+            if file_path.startswith(search_prefix):
+                return file_path[len(search_prefix) :].replace("\\", "/")
             try:
                 relative = os.path.relpath(file_path, search_path)
                 if not relative.startswith(".."):
@@ -120,6 +212,11 @@ async def _execute_grep(
     if glob_pattern:
         args.extend(["--glob", glob_pattern])
 
+    if is_directory:
+        args.append(f"--threads={_available_cpus()}")
+    else:
+        args.append("--mmap")
+
     args.extend([pattern, search_path])
 
     if cancel_event and cancel_event.is_set():
@@ -135,47 +232,49 @@ async def _execute_grep(
             stderr=asyncio.subprocess.PIPE,
         )
 
-        matches: list[tuple[str, int]] = []
+        matches: list[tuple[str, int, str | None]] = []
         output_lines: list[str] = []
         match_count = 0
         match_limit_reached = False
         lines_truncated = False
 
-        file_cache: dict[str, list[str]] = {}
-
-        def get_file_lines(file_path: str) -> list[str]:
-            if file_path not in file_cache:
-                try:
-                    with open(file_path, encoding="utf-8", errors="replace") as f:
-                        content = f.read().replace("\r\n", "\n").replace("\r", "\n")
-                        file_cache[file_path] = content.split("\n")
-                except Exception:
-                    file_cache[file_path] = []
-            return file_cache[file_path]
+        def format_block(
+            relative_path: str,
+            file_lines: list[str] | None,
+            line_number: int,
+            match_text: str | None,
+        ) -> None:
+            """Append the lines for one match straight onto output_lines."""
+            nonlocal lines_truncated
+
+            # Without context the matched line from rg's event is all we need
+            if context_value == 0 and match_text is not None:
+                truncated_text, was_truncated = truncate_line(match_text, GREP_MAX_LINE_LENGTH)
+                if was_truncated:
+                    lines_truncated = True
+                output_lines.append(f"{relative_path}:{line_number}: {truncated_text}")
+                return
 
-        def format_block(file_path: str, line_number: int) -> list[str]:
-            relative_path = format_path(file_path)
-            lines = get_file_lines(file_path)
-            if not lines:
-                return [f"{relative_path}:{line_number}: (unable to read file)"]
+            if not file_lines:
+                output_lines.append(f"{relative_path}:{line_number}: (unable to read file)")
+                return
 
-            block: list[str] = []
-            start = max(1, line_number - context_value) if context_value > 0 else line_number
-            end = min(len(lines), line_number + context_value) if context_value > 0 else line_number
+            start = line_number
+            end = line_number
+            if context_value > 0:
+                start = max(1, line_number - context_value)
+                end = min(len(file_lines), line_number + context_value)
 
             for current in range(start, end + 1):
-                line_text = lines[current - 1] if current <= len(lines) else ""
-                nonlocal lines_truncated
+                line_text = file_lines[current - 1] if current <= len(file_lines) else ""
                 truncated_text, was_truncated = truncate_line(line_text, GREP_MAX_LINE_LENGTH)
                 if was_truncated:
                     lines_truncated = True
 
                 if current == line_number:
-                    block.append(f"{relative_path}:{current}: {truncated_text}")
+                    output_lines.append(f"{relative_path}:{current}: {truncated_text}")
                 else:
-                    block.append(f"{relative_path}-{current}- {truncated_text}")
-
-            return block
+                    output_lines.append(f"{relative_path}-{current}- {truncated_text}")
 
         if process.stdout is None:
             return AgentToolResult(
@@ -183,38 +282,74 @@ async def _execute_grep(
                 details={"error": "no_stdout"},
             )
 
-        while True:
-            try:
-                line = await process.stdout.readline()
-                if not line:
-                    break
+        def handle_line(line: bytes) -> bool:
+            """Record a match from one rg JSON line; return True once the limit is hit."""
+            nonlocal match_count, match_limit_reached
 
-                line_text = line.decode("utf-8", errors="replace").strip()
-                if not line_text or match_count >= effective_limit:
-                    continue
+            line_text = line.decode("utf-8", errors="replace").strip()
+            if not line_text:
+                return False
 
-                try:
-                    event = json.loads(line_text)
-                except json.JSONDecodeError:
+            try:
+                event = json.loads(line_text)
+            except json.JSONDecodeError:
+                return False
+
+            if event.get("type") != "match":
+                return False
+
+            match_count += 1
+            data = event.get("data", {})
+            file_path = data.get("path", {}).get("text", "")
+            line_number = data.get("line_number")
+            # Absent when the line is not valid UTF-8 (rg sends "bytes")
+            match_text = data.get("lines", {}).get("text")
+            if match_text is not None:
+                match_text = match_text.split("\n", 1)[0].removesuffix("\r")
+
+            if file_path and isinstance(line_number, int):
+                matches.append((file_path, line_number, match_text))
+
+            if match_count >= effective_limit:
+                match_limit_reached = True
+                return True
+            return False
+
+        # Read stdout in large chunks and split lines ourselves: one await per
+        # chunk instead of one per JSON event.
+        partial: list[bytes] = []
+        done = False
+        stopped_early = False
+        try:
+            while not done:
+                chunk = await process.stdout.read(_READ_CHUNK_SIZE)
+                if not chunk:
+                    lines = [b"".join(partial)]
+                    done = True
+                elif b"\n" not in chunk:
+                    partial.append(chunk)
                     continue
+                else:
+                    partial.append(chunk)
+                    lines = b"".join(partial).split(b"\n")
+                    partial = [lines.pop()]
 
-                if event.get("type") == "match":
-                    match_count += 1
-                    file_path = event.get("data", {}).get("path", {}).get("text", "")
-                    line_number = event.get("data", {}).get("line_number")
-
-                    if file_path and isinstance(line_number, int):
-                        matches.append((file_path, line_number))
-
-                    if match_count >= effective_limit:
-                        match_limit_reached = True
-                        process.kill()
+                for line in lines:
+                    if handle_line(line):
+                        done = stopped_early = True
                         break
 
-            except asyncio.CancelledError:
-                break
+                if not done and cancel_event and cancel_event.is_set():
+                    done = stopped_early = True
+        finally:
+            # Cancelled (or failed) mid-read: do not leave rg running orphaned
+            if not done and process.returncode is None:
+                await _stop_process(process)
 
-        await process.wait()
+        if stopped_early:
+            await _stop_process(process)
+        else:
+            await process.wait()
 
         if cancel_event and cancel_event.is_set():
             return AgentToolResult(
@@ -228,8 +363,15 @@ async def _execute_grep(
                 details={"pattern": pattern, "matches": 0},
             )
 
-        for file_path, line_number in matches:
-            output_lines.extend(format_block(file_path, line_number))
+        # rg reports all matches of a file together, so grouping consecutive
+        # runs keeps its output order while resolving each file only once
+        for file_path, file_matches in groupby(matches, key=itemgetter(0)):
+            relative_path = format_path(file_path)
+            file_lines: list[str] | None = None
+            for _, line_number, match_text in file_matches:
+                if file_lines is None and (context_value > 0 or match_text is None):
+                    file_lines = _FILE_LINE_CACHE.get(file_path)
+                format_block(relative_path, file_lines, line_number, match_text)
 
         raw_output = "\n".join(output_lines)
         truncation = truncate_head(raw_output)
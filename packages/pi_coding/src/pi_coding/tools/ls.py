@@ -14,6 +14,8 @@ from pi_ai.types import TextContent
 from pi_coding.utils import DEFAULT_MAX_BYTES, format_size, resolve_to_cwd, truncate_head
 
 DEFAULT_LIMIT = 500
+# How many directory entries to scan between cancellation checks
+_CANCEL_CHECK_INTERVAL = 4096
 
 _LS_TOOL_PARAMETERS = {
     "type": "object",
@@ -31,6 +33,26 @@ _LS_TOOL_PARAMETERS = {
 }
 
 
+def _scan_directory(
+    dir_path: str, cancel_event: asyncio.Event | None
+) -> list[tuple[str, bool]] | None:
+    """
+    Return (name, is_dir) for every entry in dir_path, sorted case-insensitively.
+
+    Runs in a worker thread; returns None if cancel_event is set mid-scan.
+    """
+    entries: list[tuple[str, bool]] = []
+    # DirEntry.is_dir() reuses the type returned by readdir, so only
+    # symlinks cost an extra stat() (they are still followed, like isdir)
+    with os.scandir(dir_path) as it:
+        for count, entry in enumerate(it, 1):
+            if count % _CANCEL_CHECK_INTERVAL == 0 and cancel_event and cancel_event.is_set():
+                return None
+            entries.append((entry.name, entry.is_dir()))
+    entries.sort(key=lambda e: e[0].lower())
+    return entries
+
+
 async def _execute_ls(
     tool_call_id: str,
     params: dict[str, Any],
@@ -62,24 +84,28 @@ async def _execute_ls(
         )
 
     try:
-        entries = sorted(os.listdir(dir_path), key=lambda s: s.lower())
+        entries = await asyncio.to_thread(_scan_directory, dir_path, cancel_event)
     except PermissionError as e:
         return AgentToolResult(
             content=[TextContent(type="text", text=f"Error: Cannot read directory: {e}")],
             details={"error": "permission_denied", "path": dir_path},
         )
 
+    if entries is None:
+        return AgentToolResult(
+            content=[TextContent(type="text", text="Operation aborted")],
+            details={"error": "aborted"},
+        )
+
     results: list[str] = []
     entry_limit_reached = False
 
-    for entry in entries:
+    for name, is_dir in entries:
         if len(results) >= limit:
             entry_limit_reached = True
             break
 
-        full_path = os.path.join(dir_path, entry)
-        suffix = "/" if os.path.isdir(full_path) else ""
-        results.append(entry + suffix)
+        results.append(name + "/" if is_dir else name)
 
     if not results:
         return AgentToolResult(
@@ -24,6 +24,9 @@ from pi_coding.utils import (
 if TYPE_CHECKING:
     from pi_coding.utils import TruncationOptions
 
+# Text files up to this size are read in one syscall instead of streamed
+_SMALL_FILE_BYTES = 1024 * 1024
+
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 IMAGE_MIME_TYPES = {
     ".jpg": "image/jpeg",
@@ -39,6 +42,84 @@ def _detect_image_mime_type(path: str) -> str | None:
     return IMAGE_MIME_TYPES.get(ext)
 
 
+def _read_small_text(path: str, size: int) -> str:
+    """
+    Read a small file with a single unbuffered readinto() and decode it.
+
+    Newlines are normalized the same way text-mode open() would.
+    """
+    buf = bytearray(size)
+    with open(path, "rb", buffering=0) as f:
+        filled = 0
+        while filled < size:
+            n = f.readinto(memoryview(buf)[filled:])
+            if not n:
+                break
+            filled += n
+        # Pick up anything appended since the stat (rare)
+        rest = f.read() if filled == size else b""
+    if rest:
+        buf += rest
+        filled += len(rest)
+
+    # Decode straight from the buffer; the memoryview slice does not copy
+    content = str(memoryview(buf)[:filled], "utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _read_line_window(
+    path: str, start_line: int, max_lines: int, max_chars: int
+) -> tuple[list[str], int]:
+    """
+    Stream a text file and keep only the lines in the requested window.
+
+    Lines and the total count match ``content.split("\\n")`` on the whole file,
+    but at most ``max_lines`` lines are kept and collection stops once the
+    joined window exceeds ``max_chars`` characters (which always exceeds the
+    byte limit too, so truncation still reports it). The rest of the file is
+    only counted, never materialized.
+
+    Files up to ``_SMALL_FILE_BYTES`` skip the text-mode stream and are read
+    in one go instead.
+    """
+    size = os.stat(path).st_size
+    if size <= _SMALL_FILE_BYTES:
+        all_lines = _read_small_text(path, size).split("\n")
+        return all_lines[start_line : start_line + max_lines], len(all_lines)
+
+    selected: list[str] = []
+    selected_chars = 0
+    total_lines = 0
+    # An empty file, or one ending in a newline, has a trailing empty line
+    ends_with_newline = True
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            ends_with_newline = line.endswith("\n")
+            if (
+                total_lines >= start_line
+                and len(selected) < max_lines
+                and selected_chars <= max_chars
+            ):
+                text = line[:-1] if ends_with_newline else line
+                selected_chars += len(text) + (1 if selected else 0)
+                selected.append(text)
+            total_lines += 1
+
+    if ends_with_newline:
+        if (
+            total_lines >= start_line
+            and len(selected) < max_lines
+            and selected_chars <= max_chars
+        ):
+            selected.append("")
+        total_lines += 1
+
+    return selected, total_lines
+
+
 _READ_TOOL_PARAMETERS = {
     "type": "object",
     "properties": {
@@ -100,8 +181,8 @@ async def _execute_read(
 
     if mime_type:
         try:
-            with open(absolute_path, "rb") as f:
-                data = base64.standard_b64encode(f.read()).decode("utf-8")
+            raw = await asyncio.to_thread(Path(absolute_path).read_bytes)
+            data = base64.standard_b64encode(raw).decode("utf-8")
             return AgentToolResult(
                 content=[
                     TextContent(type="text", text=f"Read image file [{mime_type}]"),
@@ -116,8 +197,17 @@ async def _execute_read(
             )
 
     try:
-        with open(absolute_path, encoding="utf-8") as f:
-            content = f.read()
+        start_line = max(0, (offset or 1) - 1)
+        start_line_display = start_line + 1
+
+        # One line past the default limit is enough for truncate_head to notice
+        max_window_lines = DEFAULT_MAX_LINES + 1
+        if limit is not None:
+            max_window_lines = min(limit, max_window_lines)
+
+        selected_lines, total_file_lines = await asyncio.to_thread(
+            _read_line_window, absolute_path, start_line, max_window_lines, DEFAULT_MAX_BYTES
+        )
 
         if cancel_event and cancel_event.is_set():
             return AgentToolResult(
@@ -125,12 +215,6 @@ async def _execute_read(
                 details={"error": "aborted"},
             )
 
-        all_lines = content.split("\n")
-        total_file_lines = len(all_lines)
-
-        start_line = max(0, (offset or 1) - 1)
-        start_line_display = start_line + 1
-
         if start_line >= total_file_lines:
             return AgentToolResult(
                 content=[
@@ -142,18 +226,13 @@ async def _execute_read(
                 details={"error": "offset_out_of_bounds", "total_lines": total_file_lines},
             )
 
-        if limit is not None:
-            end_line = min(start_line + limit, total_file_lines)
-            selected_content = "\n".join(all_lines[start_line:end_line])
-            user_limited_lines = end_line - start_line
-        else:
-            selected_content = "\n".join(all_lines[start_line:])
-            user_limited_lines = None
+        selected_content = "\n".join(selected_lines)
+        user_limited_lines = len(selected_lines) if limit is not None else None
 
         truncation = truncate_head(selected_content)
 
         if truncation.first_line_exceeds_limit:
-            first_line_size = format_size(len(all_lines[start_line].encode("utf-8")))
+            first_line_size = format_size(len(selected_lines[0].encode("utf-8")))
             output_text = f"[Line {start_line_display} is {first_line_size}, exceeds {format_size(DEFAULT_MAX_BYTES)} limit. Use bash: sed -n '{start_line_display}p' {path} | head -c {DEFAULT_MAX_BYTES}]"
             return AgentToolResult(
                 content=[TextContent(type="text", text=output_text)],
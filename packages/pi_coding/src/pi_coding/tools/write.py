@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import os
+import stat
+import threading
 from pathlib import Path
 from pi_agent.types import AgentToolUpdateCallback
 from typing import Any
@@ -29,6 +31,42 @@ _WRITE_TOOL_PARAMETERS = {
 }
 
 
+def _atomic_write(path: str, data: bytes) -> None:
+    """
+    Write data to path atomically: write a sibling temp file, fsync it, then
+    os.replace() it over the target so readers never see a partial file.
+
+    Symlinks are written through, and an existing file keeps its permissions.
+    """
+    target = os.path.realpath(path)
+    try:
+        mode: int | None = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    tmp_path = f"{target}.tmp.{os.getpid()}.{threading.get_ident()}"
+    remaining = memoryview(data)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        if mode is not None:
+            os.fchmod(fd, mode)
+        while remaining:
+            written = os.write(fd, remaining)
+            remaining = remaining[written:]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+
+    try:
+        os.replace(tmp_path, target)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
 async def _execute_write(
     tool_call_id: str,
     params: dict[str, Any],
@@ -64,12 +102,14 @@ async def _execute_write(
                 details={"error": "aborted"},
             )
 
-        with open(absolute_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        lines = content.count("\n") + 1
+        encoded = content.encode("utf-8")
+        # "\n" never occurs inside a multi-byte UTF-8 sequence, so counting
+        # bytes gives the same line count without another pass over the str
+        lines = encoded.count(b"\n") + 1
         chars = len(content)
 
+        await asyncio.to_thread(_atomic_write, absolute_path, encoded)
+
         return AgentToolResult(
             content=[
                 TextContent(type="text", text=f"Successfully wrote {lines} lines ({chars} chars) to {path}")
@@ -13,6 +13,15 @@ import re
 from dataclasses import dataclass
 from typing import Literal, Optional
 
+try:
+    from diff_match_patch import diff_match_patch
+except ImportError:
+    diff_match_patch = None  # type: ignore[misc,assignment]
+
+# diff-match-patch diffs strings, so line mode encodes each unique line as one
+# code point; inputs with more unique lines than that fall back to difflib
+_MAX_DMP_LINES = 0x110000
+
 
 def detect_line_ending(content: str) -> Literal["\r\n", "\n"]:
     """Detect the dominant line ending in content."""
@@ -27,12 +36,47 @@ def detect_line_ending(content: str) -> Literal["\r\n", "\n"]:
 
 def normalize_to_lf(text: str) -> str:
     """Normalize all line endings to LF."""
+    # Pure-LF content (the common case) needs no copies at all
+    if "\r" not in text:
+        return text
     return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
 def restore_line_endings(text: str, ending: str) -> str:
     """Restore line endings to the specified type."""
-    return text.replace("\n", "\r\n") if ending == "\r\n" else text
+    if ending != "\r\n" or "\n" not in text:
+        return text
+    return text.replace("\n", "\r\n")
+
+
+_FUZZY_REPLACEMENTS = {
+    # Smart single quotes → '
+    **dict.fromkeys("\u2018\u2019\u201a\u201b", "'"),
+    # Smart double quotes → "
+    **dict.fromkeys("\u201c\u201d\u201e\u201f", '"'),
+    # Various dashes/hyphens → -
+    # U+2010 hyphen, U+2011 non-breaking hyphen, U+2012 figure dash,
+    # U+2013 en-dash, U+2014 em-dash, U+2015 horizontal bar, U+2212 minus
+    **dict.fromkeys("\u2010\u2011\u2012\u2013\u2014\u2015\u2212", "-"),
+    # Special spaces → regular space
+    # U+00A0 NBSP, U+2002-U+200A various spaces, U+202F narrow NBSP,
+    # U+205F medium math space, U+3000 ideographic space
+    **dict.fromkeys(
+        "\u00a0\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u202f\u205f\u3000", " "
+    ),
+}
+# One character class covering every key above, so a single scan replaces all
+_FUZZY_CHARS_RE = re.compile(
+    "[\u2018\u2019\u201a\u201b\u201c\u201d\u201e\u201f"
+    "\u2010-\u2015\u2212\u00a0\u2002-\u200a\u202f\u205f\u3000]"
+)
+
+# Characters normalization can produce from something else, plus newlines
+_FUZZY_ANCHOR_SPLIT_RE = re.compile("[ '\"\\-\n]+")
+
+
+def _fuzzy_replacement(match: re.Match[str]) -> str:
+    return _FUZZY_REPLACEMENTS[match.group()]
 
 
 def normalize_for_fuzzy_match(text: str) -> str:
@@ -45,19 +89,10 @@ def normalize_for_fuzzy_match(text: str) -> str:
     """
     # Strip trailing whitespace per line
     result = "\n".join(line.rstrip() for line in text.split("\n"))
-    # Smart single quotes → '
-    result = re.sub("[\u2018\u2019\u201a\u201b]", "'", result)
-    # Smart double quotes → "
-    result = re.sub('[\u201c\u201d\u201e\u201f]', '"', result)
-    # Various dashes/hyphens → -
-    # U+2010 hyphen, U+2011 non-breaking hyphen, U+2012 figure dash,
-    # U+2013 en-dash, U+2014 em-dash, U+2015 horizontal bar, U+2212 minus
-    result = re.sub("[\u2010\u2011\u2012\u2013\u2014\u2015\u2212]", "-", result)
-    # Special spaces → regular space
-    # U+00A0 NBSP, U+2002-U+200A various spaces, U+202F narrow NBSP,
-    # U+205F medium math space, U+3000 ideographic space
-    result = re.sub("[\u00a0\u2002-\u200a\u202f\u205f\u3000]", " ", result)
-    return result
+    # Every character to replace is non-ASCII
+    if result.isascii():
+        return result
+    return _FUZZY_CHARS_RE.sub(_fuzzy_replacement, result)
 
 
 @dataclass
@@ -100,19 +135,32 @@ def fuzzy_find_text(content: str, old_text: str) -> FuzzyMatchResult:
             content_for_replacement=content,
         )
 
+    not_found = FuzzyMatchResult(
+        found=False,
+        index=-1,
+        match_length=0,
+        used_fuzzy_match=False,
+        content_for_replacement=content,
+    )
+
     # Try fuzzy match – work entirely in normalized space
-    fuzzy_content = normalize_for_fuzzy_match(content)
     fuzzy_old_text = normalize_for_fuzzy_match(old_text)
+
+    # Normalization only produces spaces, quotes and hyphens, and only drops
+    # whitespace right before a newline. Any run of the needle without those
+    # characters or newlines must therefore appear verbatim in the raw content;
+    # if the longest such run does not, skip normalizing the whole file.
+    anchor = max(_FUZZY_ANCHOR_SPLIT_RE.split(fuzzy_old_text), key=len)
+    if anchor and anchor not in content:
+        return not_found
+
+    fuzzy_content = normalize_for_fuzzy_match(content)
+    # str.find already runs in C (Two-Way for long needles), so the scan itself
+    # costs little next to normalizing the content above
     fuzzy_index = fuzzy_content.find(fuzzy_old_text)
 
     if fuzzy_index == -1:
-        return FuzzyMatchResult(
-            found=False,
-            index=-1,
-            match_length=0,
-            used_fuzzy_match=False,
-            content_for_replacement=content,
-        )
+        return not_found
 
     # When fuzzy matching, we work in the normalized space for replacement.
     # This means the output will have normalized whitespace/quotes/dashes,
@@ -142,7 +190,7 @@ def strip_bom(content: str) -> tuple[str, str]:
 # Internal helpers for line-level diffing (replaces npm 'diff' package)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class _DiffPart:
     """Internal representation of a diff part, analogous to Diff.diffLines output."""
 
@@ -152,13 +200,31 @@ class _DiffPart:
 
 
 def _diff_lines(old_content: str, new_content: str) -> list[_DiffPart]:
-    """Compute line-level diffs using :mod:`difflib`, returning a list of
-    :class:`_DiffPart` objects compatible with the npm ``Diff.diffLines`` shape.
+    """Compute line-level diffs, returning a list of :class:`_DiffPart` objects
+    compatible with the npm ``Diff.diffLines`` shape.
+
+    Uses diff-match-patch's Myers diff when it is installed and falls back to
+    :mod:`difflib` otherwise.
     """
+    # Trivial cases need no matcher at all
+    if old_content == new_content:
+        return [_DiffPart(value=old_content)] if old_content else []
+    if not old_content:
+        return [_DiffPart(value=new_content, added=True)]
+    if not new_content:
+        return [_DiffPart(value=old_content, removed=True)]
+
     old_lines = old_content.splitlines(True)
     new_lines = new_content.splitlines(True)
 
-    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+    if diff_match_patch is not None:
+        dmp_parts = _diff_lines_dmp(old_lines, new_lines)
+        if dmp_parts is not None:
+            return dmp_parts
+
+    # autojunk would treat frequent lines (blank lines, closing braces) as junk
+    # in files over 200 lines, giving worse diffs of source code for no gain
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
     parts: list[_DiffPart] = []
 
     for tag, i1, i2, j1, j2 in matcher.get_opcodes():
@@ -175,6 +241,49 @@ def _diff_lines(old_content: str, new_content: str) -> list[_DiffPart]:
     return parts
 
 
+def _diff_lines_dmp(old_lines: list[str], new_lines: list[str]) -> list[_DiffPart] | None:
+    """Line-mode diff-match-patch: map each unique line to one character, diff
+    the character strings, then expand them back into lines.
+
+    Returns ``None`` when there are too many unique lines to encode.
+    Only called when diff-match-patch is installed.
+    """
+    assert diff_match_patch is not None
+    line_ids: dict[str, int] = {}
+    unique_lines: list[str] = []
+
+    def encode(lines: list[str]) -> str | None:
+        chars: list[str] = []
+        for line in lines:
+            line_id = line_ids.get(line)
+            if line_id is None:
+                line_id = len(unique_lines)
+                if line_id >= _MAX_DMP_LINES:
+                    return None
+                line_ids[line] = line_id
+                unique_lines.append(line)
+            chars.append(chr(line_id))
+        return "".join(chars)
+
+    old_chars = encode(old_lines)
+    new_chars = encode(new_lines)
+    if old_chars is None or new_chars is None:
+        return None
+
+    dmp = diff_match_patch()
+    parts: list[_DiffPart] = []
+    for op, chars in dmp.diff_main(old_chars, new_chars, False):
+        value = "".join(unique_lines[ord(c)] for c in chars)
+        parts.append(
+            _DiffPart(
+                value=value,
+                added=op == diff_match_patch.DIFF_INSERT,
+                removed=op == diff_match_patch.DIFF_DELETE,
+            )
+        )
+    return parts
+
+
 # ---------------------------------------------------------------------------
 # Public diff generation
 # ---------------------------------------------------------------------------
@@ -193,17 +302,19 @@ def generate_diff_string(
     parts = _diff_lines(old_content, new_content)
     output: list[str] = []
 
-    old_lines = old_content.split("\n")
-    new_lines = new_content.split("\n")
-    max_line_num = max(len(old_lines), len(new_lines))
+    # Only the line counts are needed here; _diff_lines does the one split
+    max_line_num = max(old_content.count("\n"), new_content.count("\n")) + 1
     line_num_width = len(str(max_line_num))
+    # Line numbers are padded with str.rjust: it measured faster than format
+    # specs, and a table of every number would cost O(lines) for any diff
+    ellipsis_line = f" {' ' * line_num_width} ..."
 
     old_line_num = 1
     new_line_num = 1
     last_was_change = False
     first_changed_line: Optional[int] = None
 
-    for i, part in enumerate(parts):
+    for part, next_part in zip(parts, [*parts[1:], None], strict=True):
         raw = part.value.split("\n")
         if raw and raw[-1] == "":
             raw.pop()
@@ -214,21 +325,23 @@ def generate_diff_string(
                 first_changed_line = new_line_num
 
             # Show the change
-            for line in raw:
-                if part.added:
-                    line_num_str = str(new_line_num).rjust(line_num_width)
-                    output.append(f"+{line_num_str} {line}")
-                    new_line_num += 1
-                else:  # removed
-                    line_num_str = str(old_line_num).rjust(line_num_width)
-                    output.append(f"-{line_num_str} {line}")
-                    old_line_num += 1
+            if part.added:
+                output += [
+                    f"+{str(num).rjust(line_num_width)} {line}"
+                    for num, line in enumerate(raw, new_line_num)
+                ]
+                new_line_num += len(raw)
+            else:  # removed
+                output += [
+                    f"-{str(num).rjust(line_num_width)} {line}"
+                    for num, line in enumerate(raw, old_line_num)
+                ]
+                old_line_num += len(raw)
             last_was_change = True
         else:
             # Context lines – only show a few before/after changes
-            next_part_is_change = (
-                i < len(parts) - 1
-                and (parts[i + 1].added or parts[i + 1].removed)
+            next_part_is_change = next_part is not None and (
+                next_part.added or next_part.removed
             )
 
             if last_was_change or next_part_is_change:
@@ -248,19 +361,20 @@ def generate_diff_string(
 
                 # Add ellipsis if we skipped lines at start
                 if skip_start > 0:
-                    output.append(f" {''.rjust(line_num_width)} ...")
+                    output.append(ellipsis_line)
                     old_line_num += skip_start
                     new_line_num += skip_start
 
-                for line in lines_to_show:
-                    line_num_str = str(old_line_num).rjust(line_num_width)
-                    output.append(f" {line_num_str} {line}")
-                    old_line_num += 1
-                    new_line_num += 1
+                output += [
+                    f" {str(num).rjust(line_num_width)} {line}"
+                    for num, line in enumerate(lines_to_show, old_line_num)
+                ]
+                old_line_num += len(lines_to_show)
+                new_line_num += len(lines_to_show)
 
                 # Add ellipsis if we skipped lines at end
                 if skip_end > 0:
-                    output.append(f" {''.rjust(line_num_width)} ...")
+                    output.append(ellipsis_line)
                     old_line_num += skip_end
                     new_line_num += skip_end
             else:
@@ -310,12 +424,10 @@ def compute_edit_diff(
         if not os.path.isfile(absolute_path) or not os.access(absolute_path, os.R_OK):
             return EditDiffError(error=f"File not found: {path}")
 
-        # Read the file
-        with open(absolute_path, encoding="utf-8") as f:
-            raw_content = f.read()
-
-        # Strip BOM before matching (LLM won't include invisible BOM in old_text)
-        _, content = strip_bom(raw_content)
+        # Read the file; utf-8-sig drops a leading BOM while decoding, since
+        # the LLM won't include the invisible BOM in old_text
+        with open(absolute_path, encoding="utf-8-sig") as f:
+            content = f.read()
 
         normalized_content = normalize_to_lf(content)
         normalized_old_text = normalize_to_lf(old_text)
@@ -332,12 +444,23 @@ def compute_edit_diff(
                 ),
             )
 
-        # Count occurrences using fuzzy-normalized content for consistency
-        fuzzy_content = normalize_for_fuzzy_match(normalized_content)
-        fuzzy_old_text = normalize_for_fuzzy_match(normalized_old_text)
-        occurrences = fuzzy_content.count(fuzzy_old_text)
-
-        if occurrences > 1:
+        # Count occurrences using fuzzy-normalized content for consistency.
+        # A fuzzy match has already normalized both, so reuse that work.
+        if match_result.used_fuzzy_match:
+            fuzzy_content = match_result.content_for_replacement
+            fuzzy_old_text = fuzzy_content[
+                match_result.index : match_result.index + match_result.match_length
+            ]
+        else:
+            fuzzy_content = normalize_for_fuzzy_match(normalized_content)
+            fuzzy_old_text = normalize_for_fuzzy_match(normalized_old_text)
+        # A second non-overlapping match settles uniqueness without scanning
+        # the whole file; the full count is only needed for the error message
+        first = fuzzy_content.find(fuzzy_old_text)
+        second = fuzzy_content.find(fuzzy_old_text, first + max(len(fuzzy_old_text), 1))
+
+        if second != -1:
+            occurrences = fuzzy_content.count(fuzzy_old_text)
             return EditDiffError(
                 error=(
                     f"Found {occurrences} occurrences of the text in {path}. "
@@ -348,11 +471,15 @@ def compute_edit_diff(
         # Compute the new content using the matched position
         # When fuzzy matching was used, content_for_replacement is the normalized version
         base_content = match_result.content_for_replacement
-        new_content = (
-            base_content[: match_result.index]
-            + normalized_new_text
-            + base_content[match_result.index + match_result.match_length :]
-        )
+        if normalized_old_text == normalized_new_text and not match_result.used_fuzzy_match:
+            # An exact match replaced by itself: skip rebuilding the content
+            new_content = base_content
+        else:
+            new_content = (
+                base_content[: match_result.index]
+                + normalized_new_text
+                + base_content[match_result.index + match_result.match_length :]
+            )
 
         # Check if it would actually change anything
         if base_content == new_content:
@@ -4,6 +4,9 @@ import re
 from urllib.parse import urlparse
 from typing import Optional
 
+_SCP_URL_RE = re.compile(r"^git@([^:]+):(.+)$")
+_PROTOCOL_URL_RE = re.compile(r"^(https?|ssh|git)://", re.I)
+
 @dataclass
 class GitSource:
     """Parsed git URL information."""
@@ -17,7 +20,7 @@ class GitSource:
 def split_ref(url: str) -> dict:
     """Split a git URL into repo and ref parts."""
     # Handle SCP-like URLs: git@github.com:user/repo@ref
-    scp_match = re.match(r"^git@([^:]+):(.+)$", url)
+    scp_match = _SCP_URL_RE.match(url)
     if scp_match:
         host = scp_match.group(1)
         path_with_maybe_ref = scp_match.group(2)
@@ -72,7 +75,7 @@ def parse_generic_git_url(url: str) -> Optional[GitSource]:
     host = ""
     path = ""
 
-    scp_match = re.match(r"^git@([^:]+):(.+)$", repo_without_ref)
+    scp_match = _SCP_URL_RE.match(repo_without_ref)
     if scp_match:
         host = scp_match.group(1)
         path = scp_match.group(2)
@@ -118,7 +121,7 @@ def parse_git_url(source: str) -> Optional[GitSource]:
     url = trimmed[4:].strip() if has_git_prefix else trimmed
 
     # Without git: prefix, only accept explicit protocol URLs or SCP-like
-    if not has_git_prefix and not re.match(r"^(https?|ssh|git)://", url, re.I) and not url.startswith("git@"):
+    if not has_git_prefix and not _PROTOCOL_URL_RE.match(url) and not url.startswith("git@"):
         return None
 
     # The TS implementation uses hosted-git-info which handles many shorthands.
@@ -4,6 +4,7 @@ Handles macOS-specific filename quirks (NFD normalization, curly quotes,
 narrow no-break spaces in screenshot timestamps, etc.).
 """
 
+import functools
 import os
 import re
 import unicodedata
@@ -21,6 +22,9 @@ _AM_PM_RE = re.compile(r" (AM|PM)\.")
 
 def normalize_unicode_spaces(s: str) -> str:
     """Replace exotic Unicode whitespace characters with plain ASCII space."""
+    # All of UNICODE_SPACES is non-ASCII, so ASCII paths skip the regex
+    if s.isascii():
+        return s
     return UNICODE_SPACES.sub(" ", s)
 
 
@@ -30,6 +34,8 @@ def try_macos_screenshot_path(file_path: str) -> str:
     macOS screenshot filenames use U+202F (narrow no-break space) before the
     AM/PM marker, but users typically type a regular space.
     """
+    if " AM." not in file_path and " PM." not in file_path:
+        return file_path
     return _AM_PM_RE.sub(f"{_NARROW_NO_BREAK_SPACE}\\1.", file_path)
 
 
@@ -39,6 +45,9 @@ def try_nfd_variant(file_path: str) -> str:
     macOS (HFS+/APFS) stores filenames in NFD form, so converting user input
     to NFD can resolve mismatches caused by composed characters.
     """
+    # ASCII is always NFD; is_normalized() uses the Unicode quick-check tables
+    if file_path.isascii() or unicodedata.is_normalized("NFD", file_path):
+        return file_path
     return unicodedata.normalize("NFD", file_path)
 
 
@@ -67,13 +76,23 @@ def normalize_at_prefix(file_path: str) -> str:
     return file_path
 
 
+@functools.cache
+def _home_dir() -> str:
+    """Return the user's home directory, resolved once per process.
+
+    Without ``$HOME`` set, :func:`os.path.expanduser` falls back to a
+    password database lookup, so it is worth not repeating per path.
+    """
+    return os.path.expanduser("~")
+
+
 def expand_path(file_path: str) -> str:
     """Expand ``~`` to the user's home directory and normalize Unicode spaces."""
     normalized = normalize_unicode_spaces(normalize_at_prefix(file_path))
     if normalized == "~":
-        return os.path.expanduser("~")
+        return _home_dir()
     if normalized.startswith("~/"):
-        return os.path.expanduser("~") + normalized[1:]
+        return _home_dir() + normalized[1:]
     return normalized
 
 
@@ -106,24 +125,24 @@ def resolve_read_path(file_path: str, cwd: str) -> str:
     if file_exists(resolved):
         return resolved
 
-    # Try macOS AM/PM variant (narrow no-break space before AM/PM)
-    am_pm_variant = try_macos_screenshot_path(resolved)
-    if am_pm_variant != resolved and file_exists(am_pm_variant):
-        return am_pm_variant
-
-    # Try NFD variant (macOS stores filenames in NFD form)
     nfd_variant = try_nfd_variant(resolved)
-    if nfd_variant != resolved and file_exists(nfd_variant):
-        return nfd_variant
-
-    # Try curly quote variant (macOS uses U+2019 in screenshot names)
-    curly_variant = try_curly_quote_variant(resolved)
-    if curly_variant != resolved and file_exists(curly_variant):
-        return curly_variant
-
-    # Try combined NFD + curly quote (for French macOS screenshots like "Capture d'écran")
-    nfd_curly_variant = try_curly_quote_variant(nfd_variant)
-    if nfd_curly_variant != resolved and file_exists(nfd_curly_variant):
-        return nfd_curly_variant
+    variants = (
+        # macOS AM/PM variant (narrow no-break space before AM/PM)
+        try_macos_screenshot_path(resolved),
+        # NFD variant (macOS stores filenames in NFD form)
+        nfd_variant,
+        # Curly quote variant (macOS uses U+2019 in screenshot names)
+        try_curly_quote_variant(resolved),
+        # Combined NFD + curly quote (for French macOS screenshots like "Capture d'écran")
+        try_curly_quote_variant(nfd_variant),
+    )
+    candidates: list[str] = []
+    for variant in variants:
+        if variant != resolved and variant not in candidates:
+            candidates.append(variant)
+
+    for candidate in candidates:
+        if file_exists(candidate):
+            return candidate
 
     return resolved
@@ -56,14 +56,16 @@ class TruncationOptions:
     max_bytes: int = DEFAULT_MAX_BYTES
 
 
+# (threshold, unit) pairs for format_size, largest first
+_SIZE_UNITS = ((1024 * 1024, "MB"), (1024, "KB"))
+
+
 def format_size(size_bytes: int) -> str:
     """Format bytes as human-readable size."""
-    if size_bytes < 1024:
-        return f"{size_bytes}B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f}KB"
-    else:
-        return f"{size_bytes / (1024 * 1024):.1f}MB"
+    for threshold, unit in _SIZE_UNITS:
+        if size_bytes >= threshold:
+            return f"{size_bytes / threshold:.1f}{unit}"
+    return f"{size_bytes}B"
 
 
 def truncate_head(
@@ -80,9 +82,10 @@ def truncate_head(
     max_lines = opts.max_lines
     max_bytes = opts.max_bytes
 
-    total_bytes = len(content.encode("utf-8"))
-    lines = content.split("\n")
-    total_lines = len(lines)
+    # Work on the UTF-8 bytes so line and byte counting run in C
+    data = content.encode("utf-8")
+    total_bytes = len(data)
+    total_lines = data.count(b"\n") + 1
 
     # Check if no truncation needed
     if total_lines <= max_lines and total_bytes <= max_bytes:
@@ -101,7 +104,8 @@ def truncate_head(
         )
 
     # Check if first line alone exceeds byte limit
-    first_line_bytes = len(lines[0].encode("utf-8"))
+    first_newline = data.find(b"\n")
+    first_line_bytes = first_newline if first_newline >= 0 else total_bytes
     if first_line_bytes > max_bytes:
         return TruncationResult(
             content="",
@@ -117,37 +121,27 @@ def truncate_head(
             max_bytes=max_bytes,
         )
 
-    # Collect complete lines that fit
-    output_lines_arr: list[str] = []
-    output_bytes_count = 0
-    truncated_by: Literal["lines", "bytes"] = "lines"
-
-    for i in range(min(len(lines), max_lines)):
-        line = lines[i]
-        line_bytes = len(line.encode("utf-8")) + (1 if i > 0 else 0)  # +1 for newline
+    # End of the last complete line that fits in max_bytes. The first line
+    # fits, so a newline at or before max_bytes exists
+    end = total_bytes if total_bytes <= max_bytes else data.rfind(b"\n", 0, max_bytes + 1)
+    output_lines = data.count(b"\n", 0, end) + 1
+    truncated_by: Literal["lines", "bytes"] = "bytes"
 
-        if output_bytes_count + line_bytes > max_bytes:
-            truncated_by = "bytes"
-            break
-
-        output_lines_arr.append(line)
-        output_bytes_count += line_bytes
-
-    # If we exited due to line limit
-    if len(output_lines_arr) >= max_lines and output_bytes_count <= max_bytes:
+    # The line limit wins whenever it is reached
+    if output_lines >= max_lines:
         truncated_by = "lines"
-
-    output_content = "\n".join(output_lines_arr)
-    final_output_bytes = len(output_content.encode("utf-8"))
+        if output_lines > max_lines:
+            output_lines = max(max_lines, 0)
+            end = _head_lines_end(data, output_lines)
 
     return TruncationResult(
-        content=output_content,
+        content=data[:end].decode("utf-8"),
         truncated=True,
         truncated_by=truncated_by,
         total_lines=total_lines,
         total_bytes=total_bytes,
-        output_lines=len(output_lines_arr),
-        output_bytes=final_output_bytes,
+        output_lines=output_lines,
+        output_bytes=end,
         last_line_partial=False,
         first_line_exceeds_limit=False,
         max_lines=max_lines,
@@ -168,9 +162,10 @@ def truncate_tail(
     max_lines = opts.max_lines
     max_bytes = opts.max_bytes
 
-    total_bytes = len(content.encode("utf-8"))
-    lines = content.split("\n")
-    total_lines = len(lines)
+    # Work on the UTF-8 bytes so line and byte counting run in C
+    data = content.encode("utf-8")
+    total_bytes = len(data)
+    total_lines = data.count(b"\n") + 1
 
     # Check if no truncation needed
     if total_lines <= max_lines and total_bytes <= max_bytes:
@@ -188,57 +183,73 @@ def truncate_tail(
             max_bytes=max_bytes,
         )
 
-    # Work backwards from the end
-    output_lines_arr: list[str] = []
-    output_bytes_count = 0
-    truncated_by: Literal["lines", "bytes"] = "lines"
-    last_line_partial = False
-
-    for i in range(len(lines) - 1, -1, -1):
-        if len(output_lines_arr) >= max_lines:
-            break
-
-        line = lines[i]
-        line_bytes = len(line.encode("utf-8")) + (
-            1 if len(output_lines_arr) > 0 else 0
-        )  # +1 for newline
-
-        if output_bytes_count + line_bytes > max_bytes:
-            truncated_by = "bytes"
-            # Edge case: if we haven't added ANY lines yet and this line exceeds maxBytes,
-            # take the end of the line (partial)
-            if len(output_lines_arr) == 0:
-                truncated_line = _truncate_string_to_bytes_from_end(line, max_bytes)
-                output_lines_arr.insert(0, truncated_line)
-                output_bytes_count = len(truncated_line.encode("utf-8"))
-                last_line_partial = True
-            break
-
-        output_lines_arr.insert(0, line)
-        output_bytes_count += line_bytes
-
-    # If we exited due to line limit
-    if len(output_lines_arr) >= max_lines and output_bytes_count <= max_bytes:
+    # Start of the first complete line that fits in max_bytes, counting back
+    # from the end; a line starts right after a newline
+    start = 0
+    if total_bytes > max_bytes:
+        start = data.find(b"\n", total_bytes - max_bytes - 1) + 1
+        if start == 0 and max_lines > 0:
+            # Edge case: the last line alone exceeds max_bytes, so take its end
+            last_line = data[data.rfind(b"\n") + 1 :].decode("utf-8")
+            output_content = _truncate_string_to_bytes_from_end(last_line, max_bytes)
+            return TruncationResult(
+                content=output_content,
+                truncated=True,
+                # The line limit wins whenever it is reached
+                truncated_by="lines" if max_lines == 1 else "bytes",
+                total_lines=total_lines,
+                total_bytes=total_bytes,
+                output_lines=1,
+                output_bytes=len(output_content.encode("utf-8")),
+                last_line_partial=True,
+                first_line_exceeds_limit=False,
+                max_lines=max_lines,
+                max_bytes=max_bytes,
+            )
+
+    output_lines = data.count(b"\n", start) + 1
+    truncated_by: Literal["lines", "bytes"] = "bytes"
+
+    # The line limit wins whenever it is reached
+    if output_lines >= max_lines:
         truncated_by = "lines"
-
-    output_content = "\n".join(output_lines_arr)
-    final_output_bytes = len(output_content.encode("utf-8"))
+        if output_lines > max_lines:
+            output_lines = max(max_lines, 0)
+            start = _tail_lines_start(data, output_lines)
 
     return TruncationResult(
-        content=output_content,
+        content=data[start:].decode("utf-8"),
         truncated=True,
         truncated_by=truncated_by,
         total_lines=total_lines,
         total_bytes=total_bytes,
-        output_lines=len(output_lines_arr),
-        output_bytes=final_output_bytes,
-        last_line_partial=last_line_partial,
+        output_lines=output_lines,
+        output_bytes=total_bytes - start,
+        last_line_partial=False,
         first_line_exceeds_limit=False,
         max_lines=max_lines,
         max_bytes=max_bytes,
     )
 
 
+def _head_lines_end(data: bytes, count: int) -> int:
+    """Byte offset where the first count lines of data end (data has more lines)."""
+    end = -1
+    for _ in range(count):
+        end = data.find(b"\n", end + 1)
+    return max(end, 0)
+
+
+def _tail_lines_start(data: bytes, count: int) -> int:
+    """Byte offset where the last count lines of data start (data has more lines)."""
+    if count <= 0:
+        return len(data)
+    start = len(data)
+    for _ in range(count):
+        start = data.rfind(b"\n", 0, start)
+    return start + 1
+
+
 def _truncate_string_to_bytes_from_end(s: str, max_bytes: int) -> str:
     """
     Truncate a string to fit within a byte limit (from the end).
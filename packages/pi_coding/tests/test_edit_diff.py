@@ -1,10 +1,6 @@
 """Tests for edit diff utilities."""
 
-import os
-import sys
-import tempfile
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
 
 from pi_coding.utils.edit_diff import (
     EditDiffError,
@@ -129,48 +125,77 @@ class TestGenerateDiffString:
         assert "+" in result["diff"]
         assert "-" in result["diff"]
 
+    def test_difflib_fallback_matches(self, monkeypatch):
+        from pi_coding.utils import edit_diff
+
+        old = "a\nb\nc\nd\ne\n"
+        new = "a\nB\nc\nd\ne\nf\n"
+        expected = generate_diff_string(old, new)
+        monkeypatch.setattr(edit_diff, "diff_match_patch", None)
+        assert generate_diff_string(old, new) == expected
+
+
+@pytest.fixture
+def make_file(tmp_path):
+    def _make_file(content: str, name: str = "file.txt") -> str:
+        path = tmp_path / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    return _make_file
+
 
 class TestComputeEditDiff:
-    def test_file_not_found(self):
-        result = compute_edit_diff("/nonexistent/file.txt", "old", "new", "/tmp")
+    def test_file_not_found(self, tmp_path):
+        result = compute_edit_diff(str(tmp_path / "missing.txt"), "old", "new", str(tmp_path))
         assert isinstance(result, EditDiffError)
         assert "not found" in result.error.lower()
 
-    def test_text_not_found(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("hello world")
-            f.flush()
-            temp_path = f.name
-
-        try:
-            result = compute_edit_diff(temp_path, "xyz", "new", os.path.dirname(temp_path))
-            assert isinstance(result, EditDiffError)
-            assert "not find" in result.error.lower()
-        finally:
-            os.unlink(temp_path)
-
-    def test_successful_diff(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("hello world")
-            f.flush()
-            temp_path = f.name
-
-        try:
-            result = compute_edit_diff(temp_path, "world", "universe", os.path.dirname(temp_path))
-            assert isinstance(result, EditDiffResult)
-            assert "universe" in result.diff
-        finally:
-            os.unlink(temp_path)
-
-    def test_multiple_occurrences(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("test test test")
-            f.flush()
-            temp_path = f.name
-
-        try:
-            result = compute_edit_diff(temp_path, "test", "new", os.path.dirname(temp_path))
-            assert isinstance(result, EditDiffError)
-            assert "occurrences" in result.error.lower()
-        finally:
-            os.unlink(temp_path)
+    def test_text_not_found(self, make_file, tmp_path):
+        path = make_file("hello world")
+        result = compute_edit_diff(path, "xyz", "new", str(tmp_path))
+        assert isinstance(result, EditDiffError)
+        assert "not find" in result.error.lower()
+
+    def test_successful_diff(self, make_file, tmp_path):
+        path = make_file("hello world")
+        result = compute_edit_diff(path, "world", "universe", str(tmp_path))
+        assert isinstance(result, EditDiffResult)
+        assert "universe" in result.diff
+
+    def test_multiple_occurrences(self, make_file, tmp_path):
+        path = make_file("test test test")
+        result = compute_edit_diff(path, "test", "new", str(tmp_path))
+        assert isinstance(result, EditDiffError)
+        assert "occurrences" in result.error.lower()
+
+    def test_identical_old_and_new_text(self, make_file, tmp_path):
+        path = make_file("hello world")
+        result = compute_edit_diff(path, "world", "world", str(tmp_path))
+        assert isinstance(result, EditDiffError)
+        assert "no changes" in result.error.lower()
+
+    def test_identical_text_not_found_reports_missing(self, make_file, tmp_path):
+        path = make_file("hello world")
+        result = compute_edit_diff(path, "xyz", "xyz", str(tmp_path))
+        assert isinstance(result, EditDiffError)
+        assert "not find" in result.error.lower()
+
+    def test_identical_ambiguous_text_reports_occurrences(self, make_file, tmp_path):
+        path = make_file("test test test")
+        result = compute_edit_diff(path, "test", "test", str(tmp_path))
+        assert isinstance(result, EditDiffError)
+        assert "3 occurrences" in result.error
+
+    def test_multiple_fuzzy_occurrences(self, make_file, tmp_path):
+        path = make_file("say “hi”\nsay “hi”  \n")
+        result = compute_edit_diff(path, 'say "hi"', "bye", str(tmp_path))
+        assert isinstance(result, EditDiffError)
+        assert "2 occurrences" in result.error
+
+    def test_bom_is_ignored(self, make_file, tmp_path):
+        path = make_file("\ufeffhello world")
+        result = compute_edit_diff(path, "hello", "goodbye", str(tmp_path))
+        assert isinstance(result, EditDiffResult)
+        assert "\ufeff" not in result.diff
+        assert result.first_changed_line == 1
@@ -1,11 +1,8 @@
 """Tests for path utilities."""
 
 import os
-import sys
 import tempfile
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from pi_coding.utils.path_utils import (
     expand_path,
     file_exists,
@@ -126,3 +123,43 @@ class TestResolveReadPath:
 
             result = resolve_read_path("test.txt", d)
             assert result == test_file
+
+    def test_macos_screenshot_variant(self):
+        with tempfile.TemporaryDirectory() as d:
+            actual = os.path.join(d, "Screenshot 2024-01-01 at 10.30 AM.png")
+            with open(actual, "w") as f:
+                f.write("png")
+
+            result = resolve_read_path("Screenshot 2024-01-01 at 10.30 AM.png", d)
+            assert result == actual
+
+    def test_nfd_curly_quote_variant(self):
+        with tempfile.TemporaryDirectory() as d:
+            actual = os.path.join(d, "Capture d’écran.png")
+            with open(actual, "w") as f:
+                f.write("png")
+
+            result = resolve_read_path("Capture d'écran.png", d)
+            assert result == actual
+
+    def test_variant_found_by_stat_when_listing_differs(self, monkeypatch):
+        from pi_coding.utils import path_utils
+
+        with tempfile.TemporaryDirectory() as d:
+            actual = os.path.join(d, "capture d’écran.png")
+            with open(actual, "w") as f:
+                f.write("png")
+
+            # Simulate a case-insensitive filesystem: stat() matches any case,
+            # while the directory listing keeps the on-disk spelling
+            def case_insensitive_exists(path):
+                parent, name = os.path.split(path)
+                try:
+                    return name.lower() in {n.lower() for n in os.listdir(parent)}
+                except OSError:
+                    return False
+
+            monkeypatch.setattr(path_utils, "file_exists", case_insensitive_exists)
+            result = resolve_read_path("Capture d'écran.png", d)
+            assert result == os.path.join(d, "Capture d’écran.png")
+
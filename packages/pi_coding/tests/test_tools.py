@@ -2,7 +2,7 @@
 
 import asyncio
 import os
-import tempfile
+import shutil
 
 import pytest
 
@@ -23,37 +23,28 @@ from pi_coding import (
     write_tool,
 )
 
+HAS_RG = shutil.which("rg") is not None
+HAS_FD = shutil.which("fd") is not None
+
 
 class TestToolCreation:
-    def test_read_tool_creation(self):
-        tool = create_read_tool("/tmp")
-        assert tool.name == "read"
+    @pytest.mark.parametrize(
+        ("factory", "name"),
+        [
+            (create_read_tool, "read"),
+            (create_write_tool, "write"),
+            (create_edit_tool, "edit"),
+            (create_bash_tool, "bash"),
+            (create_ls_tool, "ls"),
+            (create_grep_tool, "grep"),
+            (create_find_tool, "find"),
+        ],
+    )
+    def test_tool_creation(self, factory, name):
+        tool = factory("/tmp")
+        assert tool.name == name
         assert "parameters" in dir(tool)
 
-    def test_write_tool_creation(self):
-        tool = create_write_tool("/tmp")
-        assert tool.name == "write"
-
-    def test_edit_tool_creation(self):
-        tool = create_edit_tool("/tmp")
-        assert tool.name == "edit"
-
-    def test_bash_tool_creation(self):
-        tool = create_bash_tool("/tmp")
-        assert tool.name == "bash"
-
-    def test_ls_tool_creation(self):
-        tool = create_ls_tool("/tmp")
-        assert tool.name == "ls"
-
-    def test_grep_tool_creation(self):
-        tool = create_grep_tool("/tmp")
-        assert tool.name == "grep"
-
-    def test_find_tool_creation(self):
-        tool = create_find_tool("/tmp")
-        assert tool.name == "find"
-
 
 class TestReadTool:
     @pytest.mark.asyncio
@@ -68,122 +59,144 @@ class TestReadTool:
         assert "Error" in result.content[0].text or "not found" in result.content[0].text.lower()
 
     @pytest.mark.asyncio
-    async def test_read_existing_file(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("test content\nline 2")
-            temp_path = f.name
-
-        try:
-            tool = create_read_tool(os.path.dirname(temp_path))
-            result = await tool.execute(
-                "test-id",
-                {"path": os.path.basename(temp_path)},
-                None,
-                None,
-            )
-            assert "test content" in result.content[0].text
-        finally:
-            os.unlink(temp_path)
+    async def test_read_existing_file(self, tmp_path):
+        (tmp_path / "test.txt").write_text("test content\nline 2")
+
+        tool = create_read_tool(str(tmp_path))
+        result = await tool.execute(
+            "test-id",
+            {"path": "test.txt"},
+            None,
+            None,
+        )
+        assert "test content" in result.content[0].text
 
     @pytest.mark.asyncio
-    async def test_read_with_offset(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("line1\nline2\nline3\nline4\nline5")
-            temp_path = f.name
-
-        try:
-            tool = create_read_tool(os.path.dirname(temp_path))
-            result = await tool.execute(
-                "test-id",
-                {"path": os.path.basename(temp_path), "offset": 3},
-                None,
-                None,
-            )
-            assert "line3" in result.content[0].text
-            assert "line1" not in result.content[0].text
-        finally:
-            os.unlink(temp_path)
+    async def test_read_with_offset(self, tmp_path):
+        (tmp_path / "test.txt").write_text("line1\nline2\nline3\nline4\nline5")
+
+        tool = create_read_tool(str(tmp_path))
+        result = await tool.execute(
+            "test-id",
+            {"path": "test.txt", "offset": 3},
+            None,
+            None,
+        )
+        assert "line3" in result.content[0].text
+        assert "line1" not in result.content[0].text
+
+    @pytest.mark.asyncio
+    async def test_read_with_limit_reports_remaining_lines(self, tmp_path):
+        (tmp_path / "test.txt").write_text("\n".join(f"line{i}" for i in range(1, 101)))
+
+        tool = create_read_tool(str(tmp_path))
+        result = await tool.execute(
+            "test-id",
+            {"path": "test.txt", "offset": 10, "limit": 5},
+            None,
+            None,
+        )
+        text = result.content[0].text
+        assert text.startswith("line10\nline11")
+        assert "line15" not in text
+        assert "[86 more lines in file. Use offset=15 to continue.]" in text
 
 
 class TestWriteTool:
     @pytest.mark.asyncio
-    async def test_write_file(self):
-        with tempfile.TemporaryDirectory() as d:
-            tool = create_write_tool(d)
-            result = await tool.execute(
-                "test-id",
-                {"path": "test.txt", "content": "hello world"},
-                None,
-                None,
-            )
-            assert "Successfully" in result.content[0].text or "wrote" in result.content[0].text.lower()
+    async def test_write_file(self, tmp_path):
+        tool = create_write_tool(str(tmp_path))
+        result = await tool.execute(
+            "test-id",
+            {"path": "test.txt", "content": "hello world"},
+            None,
+            None,
+        )
+        assert "Successfully" in result.content[0].text or "wrote" in result.content[0].text.lower()
+        assert (tmp_path / "test.txt").read_text() == "hello world"
+
+    @pytest.mark.asyncio
+    async def test_write_creates_directories(self, tmp_path):
+        tool = create_write_tool(str(tmp_path))
+        result = await tool.execute(
+            "test-id",
+            {"path": "subdir/nested/test.txt", "content": "nested content"},
+            None,
+            None,
+        )
+        assert "Successfully" in result.content[0].text or "wrote" in result.content[0].text.lower()
+        assert (tmp_path / "subdir" / "nested" / "test.txt").read_text() == "nested content"
+
+    @pytest.mark.asyncio
+    async def test_overwrite_is_atomic_and_keeps_mode(self, tmp_path):
+        target = tmp_path / "script.sh"
+        target.write_text("old content")
+        target.chmod(0o755)
 
-            with open(os.path.join(d, "test.txt")) as f:
-                assert f.read() == "hello world"
+        tool = create_write_tool(str(tmp_path))
+        await tool.execute(
+            "test-id",
+            {"path": "script.sh", "content": "new content"},
+            None,
+            None,
+        )
+
+        assert target.read_text() == "new content"
+        assert target.stat().st_mode & 0o777 == 0o755
+        assert os.listdir(tmp_path) == ["script.sh"]
 
     @pytest.mark.asyncio
-    async def test_write_creates_directories(self):
-        with tempfile.TemporaryDirectory() as d:
-            tool = create_write_tool(d)
-            result = await tool.execute(
-                "test-id",
-                {"path": "subdir/nested/test.txt", "content": "nested content"},
-                None,
-                None,
+    async def test_concurrent_writes(self, tmp_path):
+        tool = create_write_tool(str(tmp_path))
+        names = [f"file{i}.txt" for i in range(8)]
+        await asyncio.gather(
+            *(
+                tool.execute("test-id", {"path": name, "content": name}, None, None)
+                for name in names
             )
-            assert "Successfully" in result.content[0].text or "wrote" in result.content[0].text.lower()
+        )
 
-            with open(os.path.join(d, "subdir", "nested", "test.txt")) as f:
-                assert f.read() == "nested content"
+        assert sorted(os.listdir(tmp_path)) == names
+        for name in names:
+            assert (tmp_path / name).read_text() == name
 
 
 class TestEditTool:
     @pytest.mark.asyncio
-    async def test_edit_file(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("hello world")
-            temp_path = f.name
-
-        try:
-            tool = create_edit_tool(os.path.dirname(temp_path))
-            result = await tool.execute(
-                "test-id",
-                {
-                    "path": os.path.basename(temp_path),
-                    "old_text": "world",
-                    "new_text": "universe",
-                },
-                None,
-                None,
-            )
-            assert "Successfully" in result.content[0].text or "replaced" in result.content[0].text.lower()
+    async def test_edit_file(self, tmp_path):
+        target = tmp_path / "test.txt"
+        target.write_text("hello world")
 
-            with open(temp_path) as f:
-                assert f.read() == "hello universe"
-        finally:
-            os.unlink(temp_path)
+        tool = create_edit_tool(str(tmp_path))
+        result = await tool.execute(
+            "test-id",
+            {
+                "path": "test.txt",
+                "old_text": "world",
+                "new_text": "universe",
+            },
+            None,
+            None,
+        )
+        assert "Successfully" in result.content[0].text or "replaced" in result.content[0].text.lower()
+        assert target.read_text() == "hello universe"
 
     @pytest.mark.asyncio
-    async def test_edit_text_not_found(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("hello world")
-            temp_path = f.name
-
-        try:
-            tool = create_edit_tool(os.path.dirname(temp_path))
-            result = await tool.execute(
-                "test-id",
-                {
-                    "path": os.path.basename(temp_path),
-                    "old_text": "nonexistent",
-                    "new_text": "replacement",
-                },
-                None,
-                None,
-            )
-            assert "Could not find" in result.content[0].text or "not find" in result.content[0].text.lower() or "error" in result.content[0].text.lower()
-        finally:
-            os.unlink(temp_path)
+    async def test_edit_text_not_found(self, tmp_path):
+        (tmp_path / "test.txt").write_text("hello world")
+
+        tool = create_edit_tool(str(tmp_path))
+        result = await tool.execute(
+            "test-id",
+            {
+                "path": "test.txt",
+                "old_text": "nonexistent",
+                "new_text": "replacement",
+            },
+            None,
+            None,
+        )
+        assert "Could not find" in result.content[0].text or "not find" in result.content[0].text.lower() or "error" in result.content[0].text.lower()
 
 
 class TestBashTool:
@@ -212,73 +225,92 @@ class TestBashTool:
 
 class TestLsTool:
     @pytest.mark.asyncio
-    async def test_list_directory(self):
-        with tempfile.TemporaryDirectory() as d:
-            os.makedirs(os.path.join(d, "subdir"))
-            with open(os.path.join(d, "file.txt"), "w") as f:
-                f.write("test")
-
-            tool = create_ls_tool(d)
-            result = await tool.execute(
-                "test-id",
-                {},
-                None,
-                None,
-            )
-            assert "subdir/" in result.content[0].text
-            assert "file.txt" in result.content[0].text
+    async def test_list_directory(self, tmp_path):
+        (tmp_path / "subdir").mkdir()
+        (tmp_path / "file.txt").write_text("test")
+
+        tool = create_ls_tool(str(tmp_path))
+        result = await tool.execute(
+            "test-id",
+            {},
+            None,
+            None,
+        )
+        assert "subdir/" in result.content[0].text
+        assert "file.txt" in result.content[0].text
 
     @pytest.mark.asyncio
-    async def test_list_empty_directory(self):
-        with tempfile.TemporaryDirectory() as d:
-            tool = create_ls_tool(d)
-            result = await tool.execute(
-                "test-id",
-                {},
-                None,
-                None,
-            )
-            assert "empty" in result.content[0].text.lower()
+    async def test_list_empty_directory(self, tmp_path):
+        tool = create_ls_tool(str(tmp_path))
+        result = await tool.execute(
+            "test-id",
+            {},
+            None,
+            None,
+        )
+        assert "empty" in result.content[0].text.lower()
 
 
 class TestGrepTool:
     @pytest.mark.asyncio
-    async def test_grep_search(self):
-        import shutil
-        if not shutil.which("rg"):
-            pytest.skip("ripgrep (rg) not available")
-        with tempfile.TemporaryDirectory() as d:
-            with open(os.path.join(d, "test.txt"), "w") as f:
-                f.write("hello world\nfoo bar\nhello again")
-
-            tool = create_grep_tool(d)
-            result = await tool.execute(
-                "test-id",
-                {"pattern": "hello"},
-                None,
-                None,
-            )
-            assert "hello" in result.content[0].text
+    @pytest.mark.skipif(not HAS_RG, reason="ripgrep (rg) not available")
+    async def test_grep_search(self, tmp_path):
+        (tmp_path / "test.txt").write_text("hello world\nfoo bar\nhello again")
+
+        tool = create_grep_tool(str(tmp_path))
+        result = await tool.execute(
+            "test-id",
+            {"pattern": "hello"},
+            None,
+            None,
+        )
+        assert "hello" in result.content[0].text
 
 
 class TestFindTool:
     @pytest.mark.asyncio
-    async def test_find_by_pattern(self):
-        import shutil
-        if not shutil.which("fd"):
-            pytest.skip("fd not available")
-        with tempfile.TemporaryDirectory() as d:
-            with open(os.path.join(d, "test.txt"), "w") as f:
-                f.write("test")
-            with open(os.path.join(d, "other.py"), "w") as f:
-                f.write("print('test')")
-
-            tool = create_find_tool(d)
-            result = await tool.execute(
-                "test-id",
-                {"pattern": "*.py"},
-                None,
-                None,
-            )
-            assert "other.py" in result.content[0].text
-            assert "test.txt" not in result.content[0].text
+    @pytest.mark.skipif(not HAS_FD, reason="fd not available")
+    async def test_find_by_pattern(self, tmp_path):
+        (tmp_path / "test.txt").write_text("test")
+        (tmp_path / "other.py").write_text("print('test')")
+
+        tool = create_find_tool(str(tmp_path))
+        result = await tool.execute(
+            "test-id",
+            {"pattern": "*.py"},
+            None,
+            None,
+        )
+        assert "other.py" in result.content[0].text
+        assert "test.txt" not in result.content[0].text
+
+
+class TestFileLineCache:
+    def test_reloads_modified_file_and_evicts_lru(self, tmp_path):
+        from pi_coding.tools.grep import _FileLineCache
+
+        # Rewrites keep the mtime fixed, so only a size change or an eviction
+        # makes the cache read a file again
+        def write(path, text):
+            path.write_text(text)
+            os.utime(path, ns=(0, 0))
+
+        cache = _FileLineCache(max_files=2)
+        a, b, c = (tmp_path / name for name in ("a.txt", "b.txt", "c.txt"))
+        for path in (a, b, c):
+            write(path, f"{path.stem}1\n{path.stem}2")
+
+        assert cache.get(str(a)) == ["a1", "a2"]
+        write(a, "changed")
+        assert cache.get(str(a)) == ["changed"]
+
+        cache.get(str(b))
+        cache.get(str(c))
+
+        # b is still cached, so a same-size rewrite goes unnoticed...
+        write(b, "B1\nB2")
+        assert cache.get(str(b)) == ["b1", "b2"]
+        # ...while a was evicted as least recently used and is read again
+        write(a, "CHANGES")
+        assert cache.get(str(a)) == ["CHANGES"]
+        assert cache.get(str(tmp_path / "missing.txt")) == []
@@ -1,9 +1,5 @@
 """Tests for truncation utilities."""
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from pi_coding.utils.truncate import (
     DEFAULT_MAX_BYTES,
     DEFAULT_MAX_LINES,
@@ -87,6 +83,14 @@ class TestTruncateHead:
         assert not result.truncated
         assert result.content == ""
 
+    def test_truncate_by_bytes_keeps_whole_multibyte_lines(self):
+        content = "\n".join(["héllo"] * 10)  # 6 bytes per line
+        result = truncate_head(content, TruncationOptions(max_bytes=19))
+        assert result.truncated_by == "bytes"
+        assert result.content == "héllo\nhéllo"
+        assert result.output_lines == 2
+        assert result.output_bytes == 13
+
 
 class TestTruncateTail:
     def test_no_truncation_needed(self):
@@ -110,3 +114,18 @@ class TestTruncateTail:
         assert "line8" in result.content
         assert "line9" in result.content
         assert "line0" not in result.content
+
+    def test_truncate_by_bytes_keeps_whole_multibyte_lines(self):
+        content = "\n".join(["héllo"] * 10)  # 6 bytes per line
+        result = truncate_tail(content, TruncationOptions(max_bytes=19))
+        assert result.truncated_by == "bytes"
+        assert result.content == "héllo\nhéllo"
+        assert result.output_lines == 2
+        assert result.output_bytes == 13
+
+    def test_partial_last_line(self):
+        content = "short\n" + "é" * 100
+        result = truncate_tail(content, TruncationOptions(max_bytes=11))
+        assert result.last_line_partial
+        assert result.content == "é" * 5
+        assert result.output_lines == 1
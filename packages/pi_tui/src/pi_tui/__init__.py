@@ -4,47 +4,106 @@ pi-tui: Terminal UI library with differential rendering
 Python port of @mariozechner/pi-tui from the pi-mono monorepo.
 
 TypeScript Reference: _ts_reference/tui.ts, _ts_reference/index.ts
+
+Submodules are imported on first attribute access (PEP 562), so importing
+pi_tui does not pull in every component and its dependencies.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from pi_tui.component import Component, Focusable, is_focusable
-from pi_tui.components import (
-    Box,
-    CancellableLoader,
-    DefaultSelectListTheme,
-    Input,
-    Loader,
-    SelectItem,
-    SelectList,
-    Spacer,
-    Text,
-    TruncatedText,
-)
-from pi_tui.container import Container
-from pi_tui.keys import (
-    Key,
-    KeyEventType,
-    KeyId,
-    is_key_release,
-    is_key_repeat,
-    matches_key,
-    parse_key,
-)
-from pi_tui.stdin_buffer import StdinBuffer, StdinBufferOptions
-from pi_tui.terminal import ProcessTerminal, Terminal
-from pi_tui.tui import (
-    CURSOR_MARKER,
-    TUI,
-    OverlayAnchor,
-    OverlayHandle,
-    OverlayMargin,
-    OverlayOptions,
-    SizeValue,
-)
-from pi_tui.utils import (
-    truncate_to_width,
-    visible_width,
-    wrap_text_with_ansi,
-)
+
+if TYPE_CHECKING:
+    from pi_tui.components import (
+        Box,
+        CancellableLoader,
+        DefaultSelectListTheme,
+        Input,
+        Loader,
+        SelectItem,
+        SelectList,
+        Spacer,
+        Text,
+        TruncatedText,
+    )
+    from pi_tui.container import Container
+    from pi_tui.keys import (
+        Key,
+        KeyEventType,
+        KeyId,
+        is_key_release,
+        is_key_repeat,
+        matches_key,
+        parse_key,
+    )
+    from pi_tui.stdin_buffer import StdinBuffer, StdinBufferOptions
+    from pi_tui.terminal import ProcessTerminal, Terminal
+    from pi_tui.tui import (
+        CURSOR_MARKER,
+        TUI,
+        OverlayAnchor,
+        OverlayHandle,
+        OverlayMargin,
+        OverlayOptions,
+        SizeValue,
+    )
+    from pi_tui.utils import (
+        truncate_to_width,
+        visible_width,
+        wrap_text_with_ansi,
+    )
+
+# Public name -> module that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "Container": "pi_tui.container",
+    "TUI": "pi_tui.tui",
+    "CURSOR_MARKER": "pi_tui.tui",
+    "OverlayAnchor": "pi_tui.tui",
+    "OverlayHandle": "pi_tui.tui",
+    "OverlayMargin": "pi_tui.tui",
+    "OverlayOptions": "pi_tui.tui",
+    "SizeValue": "pi_tui.tui",
+    "Terminal": "pi_tui.terminal",
+    "ProcessTerminal": "pi_tui.terminal",
+    "Key": "pi_tui.keys",
+    "KeyId": "pi_tui.keys",
+    "KeyEventType": "pi_tui.keys",
+    "parse_key": "pi_tui.keys",
+    "matches_key": "pi_tui.keys",
+    "is_key_release": "pi_tui.keys",
+    "is_key_repeat": "pi_tui.keys",
+    "StdinBuffer": "pi_tui.stdin_buffer",
+    "StdinBufferOptions": "pi_tui.stdin_buffer",
+    "visible_width": "pi_tui.utils",
+    "truncate_to_width": "pi_tui.utils",
+    "wrap_text_with_ansi": "pi_tui.utils",
+    "Text": "pi_tui.components.text",
+    "Box": "pi_tui.components.box",
+    "TruncatedText": "pi_tui.components.truncated_text",
+    "Spacer": "pi_tui.components.spacer",
+    "Loader": "pi_tui.components.loader",
+    "CancellableLoader": "pi_tui.components.cancellable_loader",
+    "Input": "pi_tui.components.input",
+    "SelectList": "pi_tui.components.select_list",
+    "SelectItem": "pi_tui.components.select_list",
+    "DefaultSelectListTheme": "pi_tui.components.select_list",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "Component",
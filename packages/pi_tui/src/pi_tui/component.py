@@ -62,6 +62,18 @@ class Component(ABC):
         # Default implementation: no-op (can be called without error)
         return
 
+    def is_clean(self, width: int) -> bool:
+        """Whether render(width) would return the same lines as last time.
+
+        Containers use this to reuse their cached output without rendering
+        children. Only return True when that is certain.
+
+        Args:
+            width: Viewport width the component would be rendered at
+        """
+        # Default implementation: unknown, so always render
+        return False
+
     wants_key_release: bool = False
     """If True, component receives key release events (Kitty protocol)."""
 
@@ -94,3 +106,21 @@ def is_focusable(component: Component | None) -> bool:
         True if component implements Focusable protocol
     """
     return component is not None and hasattr(component, "focused")
+
+
+def is_render_clean(component: Component, width: int) -> bool:
+    """
+    Check whether a child can be reused without re-rendering.
+
+    Duck-typed components that only provide render()/invalidate() have no
+    is_clean() and are treated as changed.
+
+    Args:
+        component: Component to check
+        width: Viewport width it would be rendered at
+
+    Returns:
+        True if the component reports its last render is still valid
+    """
+    is_clean = getattr(component, "is_clean", None)
+    return is_clean is not None and is_clean(width)
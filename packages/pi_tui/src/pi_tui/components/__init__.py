@@ -1,17 +1,52 @@
 """
 pi-tui components module.
 
+Components are imported on first attribute access (PEP 562).
+
 TypeScript Reference: _ts_reference/components/*.ts
 """
 
-from pi_tui.components.box import Box
-from pi_tui.components.cancellable_loader import CancellableLoader
-from pi_tui.components.input import Input
-from pi_tui.components.loader import Loader
-from pi_tui.components.select_list import DefaultSelectListTheme, SelectItem, SelectList
-from pi_tui.components.spacer import Spacer
-from pi_tui.components.text import Text
-from pi_tui.components.truncated_text import TruncatedText
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pi_tui.components.box import Box
+    from pi_tui.components.cancellable_loader import CancellableLoader
+    from pi_tui.components.input import Input
+    from pi_tui.components.loader import Loader
+    from pi_tui.components.select_list import DefaultSelectListTheme, SelectItem, SelectList
+    from pi_tui.components.spacer import Spacer
+    from pi_tui.components.text import Text
+    from pi_tui.components.truncated_text import TruncatedText
+
+# Public name -> module that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "Text": "pi_tui.components.text",
+    "Box": "pi_tui.components.box",
+    "TruncatedText": "pi_tui.components.truncated_text",
+    "Spacer": "pi_tui.components.spacer",
+    "Loader": "pi_tui.components.loader",
+    "CancellableLoader": "pi_tui.components.cancellable_loader",
+    "Input": "pi_tui.components.input",
+    "SelectList": "pi_tui.components.select_list",
+    "SelectItem": "pi_tui.components.select_list",
+    "DefaultSelectListTheme": "pi_tui.components.select_list",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "Text",
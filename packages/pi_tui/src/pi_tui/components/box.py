@@ -6,19 +6,26 @@ TypeScript Reference: _ts_reference/components/box.ts
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from pi_tui.component import Component
+from pi_tui.component import Component, is_render_clean
 from pi_tui.utils import apply_background_to_line, visible_width
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+# Styled lines kept per Box between renders; cleared wholesale once full
+_BG_LINE_CACHE_SIZE = 512
+# Padded child lines up to this length are interned to bound the intern table
+_INTERN_MAX_LEN = 256
 
-@dataclass
+
+@dataclass(slots=True)
 class _RenderCache:
     """Cache for rendered output."""
+    children: tuple[Component, ...]
     child_lines: list[str]
     width: int
     bg_sample: str | None
@@ -42,12 +49,19 @@ class Box(Component):
         self._padding_y = padding_y
         self._bg_fn = bg_fn
         self._cache: _RenderCache | None = None
+        self._bg_line_cache: dict[tuple[str, int], str] = {}
+        self._bg_line_cache_sample: str | None = None
+        # Set by invalidate() and cleared by render(); repeat invalidations
+        # before the next render have nothing new to propagate to children
+        self._dirty = False
         self.children: list[Component] = []
 
     def add_child(self, component: Component) -> None:
         """Add a child component."""
         self.children.append(component)
         self._invalidate_cache()
+        # The new child missed any earlier invalidation
+        self._dirty = False
 
     def remove_child(self, component: Component) -> None:
         """Remove a child component."""
@@ -65,10 +79,12 @@ class Box(Component):
     def set_bg_fn(self, bg_fn: Callable[[str], str] | None) -> None:
         """Set the background function."""
         self._bg_fn = bg_fn
+        self._bg_line_cache.clear()
 
     def _invalidate_cache(self) -> None:
         """Clear the render cache."""
         self._cache = None
+        self._bg_line_cache.clear()
 
     def _match_cache(
         self, width: int, child_lines: list[str], bg_sample: str | None
@@ -76,45 +92,95 @@ class Box(Component):
         """Check if cache is still valid."""
         if self._cache is None:
             return False
+        # list.__eq__ checks the lengths first, then compares element by
+        # element in C, skipping the character compare for identical strings
         return (
             self._cache.width == width
             and self._cache.bg_sample == bg_sample
-            and len(self._cache.child_lines) == len(child_lines)
-            and all(
-                self._cache.child_lines[i] == child_lines[i]
-                for i in range(len(child_lines))
-            )
+            and self._cache.child_lines == child_lines
         )
 
     def invalidate(self) -> None:
         """Invalidate this component and all children."""
         self._invalidate_cache()
+        if self._dirty:
+            return
+        self._dirty = True
         for child in self.children:
             child.invalidate()
 
+    def _children_unchanged(self, cache: _RenderCache) -> bool:
+        """Check that children is the same components, in order, as when cached."""
+        # children is a public list callers may mutate directly, so compare it
+        # by identity rather than relying on add_child()/remove_child()
+        children = self.children
+        return len(cache.children) == len(children) and all(
+            cached is child for cached, child in zip(cache.children, children, strict=True)
+        )
+
+    def is_clean(self, width: int) -> bool:
+        """Check whether the cached output is still valid for this width."""
+        cache = self._cache
+        if cache is None or cache.width != width or not self._children_unchanged(cache):
+            return False
+        bg_sample = self._bg_fn("test") if self._bg_fn else None
+        if cache.bg_sample != bg_sample:
+            return False
+        content_width = max(1, width - self._padding_x * 2)
+        return all(is_render_clean(child, content_width) for child in self.children)
+
     def _apply_bg(self, line: str, width: int) -> str:
         """Apply background to a line."""
+        key = (line, width)
+        styled = self._bg_line_cache.get(key)
+        if styled is not None:
+            return styled
+
         vis_len = visible_width(line)
         pad_needed = max(0, width - vis_len)
-        padded = line + " " * pad_needed
+        styled = line + " " * pad_needed
 
         if self._bg_fn:
-            return apply_background_to_line(padded, width, self._bg_fn)
-        return padded
+            styled = apply_background_to_line(styled, width, self._bg_fn)
+
+        if len(self._bg_line_cache) >= _BG_LINE_CACHE_SIZE:
+            self._bg_line_cache.clear()
+        self._bg_line_cache[key] = styled
+        return styled
 
     def render(self, width: int) -> list[str]:
         """Render the box component."""
+        self._dirty = False
         if not self.children:
             return []
 
         content_width = max(1, width - self._padding_x * 2)
+
+        # Nothing changed since the last frame: skip rendering the children
+        cache = self._cache
+        if (
+            cache is not None
+            and cache.width == width
+            and self._children_unchanged(cache)
+            and all(is_render_clean(child, content_width) for child in self.children)
+            and cache.bg_sample == (self._bg_fn("test") if self._bg_fn else None)
+        ):
+            return cache.lines
+
         left_pad = " " * self._padding_x
 
-        child_lines: list[str] = []
-        for child in self.children:
-            lines = child.render(content_width)
-            for line in lines:
-                child_lines.append(left_pad + line)
+        if left_pad:
+            # Padding builds new strings every frame; interning short ones lets
+            # the cache comparison below match them by identity
+            child_lines = []
+            intern = sys.intern
+            for child in self.children:
+                for line in child.render(content_width):
+                    padded = left_pad + line
+                    child_lines.append(intern(padded) if len(padded) <= _INTERN_MAX_LEN else padded)
+        else:
+            # No padding: reuse the children's strings as they are
+            child_lines = [line for child in self.children for line in child.render(content_width)]
 
         if not child_lines:
             return []
@@ -123,20 +189,23 @@ class Box(Component):
 
         if self._match_cache(width, child_lines, bg_sample):
             assert self._cache is not None
+            self._cache.children = tuple(self.children)
             return self._cache.lines
 
-        result: list[str] = []
-
-        for _ in range(self._padding_y):
-            result.append(self._apply_bg("", width))
+        # A changed sample means the bg function's output changed under us
+        if bg_sample != self._bg_line_cache_sample:
+            self._bg_line_cache.clear()
+            self._bg_line_cache_sample = bg_sample
 
-        for line in child_lines:
-            result.append(self._apply_bg(line, width))
-
-        for _ in range(self._padding_y):
-            result.append(self._apply_bg("", width))
+        # Every padding row is the same styled blank line, so style it once
+        padding_rows = (
+            [self._apply_bg("", width)] * self._padding_y if self._padding_y > 0 else []
+        )
+        apply_bg = self._apply_bg
+        result = padding_rows + [apply_bg(line, width) for line in child_lines] + padding_rows
 
         self._cache = _RenderCache(
+            children=tuple(self.children),
             child_lines=child_lines,
             width=width,
             bg_sample=bg_sample,
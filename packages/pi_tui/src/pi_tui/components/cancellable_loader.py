@@ -42,7 +42,9 @@ class CancellableLoader(Loader):
 
     def handle_input(self, data: str) -> None:
         """Handle input - Escape aborts the loader."""
-        if matches_key(data, Key.escape):
+        # A bare ESC byte is by far the common case; only other input needs
+        # the full key matcher (e.g. Kitty-protocol escape sequences)
+        if data == "\x1b" or matches_key(data, Key.escape):
             self._aborted = True
             if self.on_abort:
                 self.on_abort()
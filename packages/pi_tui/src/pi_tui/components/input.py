@@ -6,7 +6,8 @@ TypeScript Reference: _ts_reference/components/input.ts
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections import deque
+from typing import TYPE_CHECKING, Any
 
 from pi_tui.component import Component
 from pi_tui.keys import Key, matches_key
@@ -17,6 +18,20 @@ if TYPE_CHECKING:
 
 CURSOR_MARKER = "\x1b_pi:c\x07"
 
+# Undo entries kept per Input; the oldest are dropped beyond this
+_UNDO_LIMIT = 256
+
+# Reverse video on/off, used to draw the cursor
+_REVERSE = "\x1b[7m"
+_REVERSE_OFF = "\x1b[27m"
+
+# Bracketed paste markers
+_PASTE_START = "\x1b[200~"
+_PASTE_END = "\x1b[201~"
+
+# Pasted text is kept on one line by dropping CR and LF
+_STRIP_LINE_BREAKS = str.maketrans("", "", "\r\n")
+
 
 class Input(Component):
     """
@@ -32,156 +47,224 @@ class Input(Component):
         on_submit: Callable[[str], None] | None = None,
         on_escape: Callable[[], None] | None = None,
     ) -> None:
-        self._value = value
-        self._cursor = len(value)
+        # Gap buffer: characters before the cursor, and characters after it
+        # in reverse order, so edits at the cursor are list appends and pops
+        self._left: list[str] = list(value)
+        self._right: list[str] = []
+        self._value_cache: str | None = value
         self._prompt = prompt
         self._on_submit = on_submit
         self._on_escape = on_escape
         self.focused = False
 
-        self._paste_buffer = ""
+        # Chunks of an unfinished bracketed paste, joined once it ends
+        self._paste_chunks: list[str] = []
+        self._paste_tail = ""
         self._is_in_paste = False
 
-        self._undo_stack: list[tuple[str, int]] = []
+        # (position, removed text, inserted length, cursor before the edit)
+        self._undo_stack: deque[tuple[int, str, int, int]] = deque(maxlen=_UNDO_LIMIT)
+
+    @property
+    def _value(self) -> str:
+        """The full input value, joined from the gap buffer on demand."""
+        if self._value_cache is None:
+            self._value_cache = "".join(self._left) + "".join(reversed(self._right))
+        return self._value_cache
+
+    @property
+    def _cursor(self) -> int:
+        """Cursor position in characters."""
+        return len(self._left)
 
     def get_value(self) -> str:
         """Get the current input value."""
         return self._value
 
     def set_value(self, value: str) -> None:
-        """Set the input value."""
-        self._value = value
-        self._cursor = min(self._cursor, len(value))
-
-    def _push_undo(self) -> None:
-        """Push current state to undo stack."""
-        self._undo_stack.append((self._value, self._cursor))
+        """Set the input value.
+
+        Clears the undo history, whose edits refer to the previous value.
+        """
+        self._undo_stack.clear()
+        cursor = min(self._cursor, len(value))
+        self._left = list(value[:cursor])
+        self._right = list(reversed(value[cursor:]))
+        self._value_cache = value
+
+    def _move_cursor(self, position: int) -> None:
+        """Move the cursor (and the gap) to position."""
+        left = self._left
+        cursor = len(left)
+        if position < cursor:
+            moved = left[position:]
+            del left[position:]
+            moved.reverse()
+            self._right.extend(moved)
+        elif position > cursor:
+            right = self._right
+            moved = right[cursor - position :]
+            del right[cursor - position :]
+            moved.reverse()
+            left.extend(moved)
+
+    def _replace(self, position: int, count: int, text: str = "") -> None:
+        """Replace count characters at position with text, recording undo.
+
+        The cursor ends up after the inserted text.
+        """
+        cursor_before = len(self._left)
+        self._move_cursor(position)
+        removed = ""
+        if count > 0:
+            right = self._right
+            removed = "".join(reversed(right[-count:]))
+            del right[-count:]
+        self._left.extend(text)
+        self._value_cache = None
+        self._undo_stack.append((position, removed, len(text), cursor_before))
 
     def _undo(self) -> None:
         """Undo last change."""
         if not self._undo_stack:
             return
-        self._value, self._cursor = self._undo_stack.pop()
+        position, removed, inserted, cursor_before = self._undo_stack.pop()
+        self._move_cursor(position + inserted)
+        if inserted > 0:
+            del self._left[-inserted:]
+        self._left.extend(removed)
+        self._move_cursor(cursor_before)
+        self._value_cache = None
 
     def handle_input(self, data: str) -> None:
         """Handle input data."""
-        if "\x1b[200~" in data:
-            self._is_in_paste = True
-            self._paste_buffer = ""
-            data = data.replace("\x1b[200~", "")
-
-        if self._is_in_paste:
-            self._paste_buffer += data
-            end_index = self._paste_buffer.find("\x1b[201~")
-            if end_index != -1:
-                paste_content = self._paste_buffer[:end_index]
-                self._handle_paste(paste_content)
-                self._is_in_paste = False
-                remaining = self._paste_buffer[end_index + 6:]
-                self._paste_buffer = ""
-                if remaining:
-                    self.handle_input(remaining)
-            return
-
-        if matches_key(data, Key.escape):
-            if self._on_escape:
-                self._on_escape()
+        while self._is_in_paste or _PASTE_START in data:
+            if _PASTE_START in data:
+                self._is_in_paste = True
+                self._paste_chunks = []
+                self._paste_tail = ""
+                data = data.replace(_PASTE_START, "")
+
+            # The end marker may straddle earlier chunks, so look for it in
+            # the last few characters received before this chunk too
+            probe = self._paste_tail + data
+            if _PASTE_END not in probe:
+                self._paste_chunks.append(data)
+                self._paste_tail = probe[-(len(_PASTE_END) - 1) :]
+                return
+
+            buffer = "".join(self._paste_chunks) + data
+            end_index = buffer.find(_PASTE_END)
+            self._handle_paste(buffer[:end_index])
+            self._is_in_paste = False
+            self._paste_chunks = []
+            self._paste_tail = ""
+            # Anything after the paste is handled as ordinary input
+            data = buffer[end_index + len(_PASTE_END) :]
+            if not data:
+                return
+
+        # Printable characters are by far the common case and match no key
+        # binding, so insert them without walking the key map
+        if len(data) == 1 and data >= " " and data != "\x7f":
+            self._insert_character(data)
             return
 
-        if matches_key(data, Key.ctrl("z")):
-            self._undo()
-            return
+        for key_id, handler in self._KEY_BINDINGS:
+            if matches_key(data, key_id):
+                handler(self)
+                return
 
-        if matches_key(data, Key.enter):
-            if self._on_submit:
-                self._on_submit(self._value)
-            return
-
-        if matches_key(data, Key.backspace):
-            self._handle_backspace()
-            return
-
-        if matches_key(data, Key.delete):
-            self._handle_forward_delete()
-            return
+        code = ord(data[0]) if data else 0
+        if code >= 32 and code != 127:
+            self._insert_character(data)
 
-        if matches_key(data, Key.left):
-            if self._cursor > 0:
-                self._cursor -= 1
-            return
+    def _handle_escape(self) -> None:
+        """Handle escape key."""
+        if self._on_escape:
+            self._on_escape()
 
-        if matches_key(data, Key.right):
-            if self._cursor < len(self._value):
-                self._cursor += 1
-            return
+    def _handle_submit(self) -> None:
+        """Handle enter key."""
+        if self._on_submit:
+            self._on_submit(self._value)
 
-        if matches_key(data, Key.ctrl("a")):
-            self._cursor = 0
-            return
+    def _cursor_left(self) -> None:
+        """Move the cursor one character left."""
+        if self._left:
+            self._right.append(self._left.pop())
 
-        if matches_key(data, Key.ctrl("e")):
-            self._cursor = len(self._value)
-            return
+    def _cursor_right(self) -> None:
+        """Move the cursor one character right."""
+        if self._right:
+            self._left.append(self._right.pop())
 
-        if matches_key(data, Key.ctrl("u")):
-            if self._cursor > 0:
-                self._push_undo()
-                self._value = self._value[self._cursor:]
-                self._cursor = 0
-            return
+    def _cursor_to_start(self) -> None:
+        """Move the cursor to the start of the line."""
+        self._move_cursor(0)
 
-        if matches_key(data, Key.ctrl("k")):
-            if self._cursor < len(self._value):
-                self._push_undo()
-                self._value = self._value[:self._cursor]
-            return
+    def _cursor_to_end(self) -> None:
+        """Move the cursor to the end of the line."""
+        self._move_cursor(len(self._left) + len(self._right))
 
-        if matches_key(data, Key.ctrl("w")):
-            self._delete_word_backward()
-            return
+    def _delete_to_start(self) -> None:
+        """Delete everything before the cursor."""
+        if self._left:
+            self._replace(0, len(self._left))
 
-        code = ord(data[0]) if data else 0
-        if code >= 32 and code != 127:
-            self._insert_character(data)
+    def _delete_to_end(self) -> None:
+        """Delete everything after the cursor."""
+        if self._right:
+            self._replace(self._cursor, len(self._right))
 
     def _insert_character(self, char: str) -> None:
         """Insert a character at cursor position."""
-        self._push_undo()
-        self._value = self._value[:self._cursor] + char + self._value[self._cursor:]
-        self._cursor += len(char)
+        self._replace(self._cursor, 0, char)
 
     def _handle_backspace(self) -> None:
         """Handle backspace key."""
-        if self._cursor > 0:
-            self._push_undo()
-            self._value = self._value[:self._cursor - 1] + self._value[self._cursor:]
-            self._cursor -= 1
+        if self._left:
+            self._replace(self._cursor - 1, 1)
 
     def _handle_forward_delete(self) -> None:
         """Handle delete key."""
-        if self._cursor < len(self._value):
-            self._push_undo()
-            self._value = self._value[:self._cursor] + self._value[self._cursor + 1:]
+        if self._right:
+            self._replace(self._cursor, 1)
 
     def _delete_word_backward(self) -> None:
         """Delete word before cursor."""
-        if self._cursor == 0:
+        cursor = self._cursor
+        if cursor == 0:
             return
-        self._push_undo()
-        new_cursor = self._cursor
-        while new_cursor > 0 and self._value[new_cursor - 1].isspace():
-            new_cursor -= 1
-        while new_cursor > 0 and not self._value[new_cursor - 1].isspace():
-            new_cursor -= 1
-        self._value = self._value[:new_cursor] + self._value[self._cursor:]
-        self._cursor = new_cursor
+        # Drop trailing whitespace, then the last whitespace-separated word;
+        # rstrip and rsplit scan from the end in C
+        before = self._value[:cursor].rstrip()
+        words = before.rsplit(None, 1)
+        new_cursor = len(before) - len(words[-1]) if words else 0
+        self._replace(new_cursor, cursor - new_cursor)
 
     def _handle_paste(self, text: str) -> None:
         """Handle pasted text."""
-        self._push_undo()
-        clean_text = text.replace("\r\n", "").replace("\r", "").replace("\n", "")
-        self._value = self._value[:self._cursor] + clean_text + self._value[self._cursor:]
-        self._cursor += len(clean_text)
+        clean_text = text.translate(_STRIP_LINE_BREAKS)
+        self._replace(self._cursor, 0, clean_text)
+
+    # Checked in order; the first matching key wins
+    # Handlers are the plain functions defined above, called with the instance;
+    # typed Any since checkers see them as Self-bound inside the class body
+    _KEY_BINDINGS: tuple[tuple[str, Callable[[Any], None]], ...] = (
+        (Key.escape, _handle_escape),
+        (Key.ctrl("z"), _undo),
+        (Key.enter, _handle_submit),
+        (Key.backspace, _handle_backspace),
+        (Key.delete, _handle_forward_delete),
+        (Key.left, _cursor_left),
+        (Key.right, _cursor_right),
+        (Key.ctrl("a"), _cursor_to_start),
+        (Key.ctrl("e"), _cursor_to_end),
+        (Key.ctrl("u"), _delete_to_start),
+        (Key.ctrl("k"), _delete_to_end),
+        (Key.ctrl("w"), _delete_word_backward),
+    )
 
     def invalidate(self) -> None:
         pass
@@ -194,47 +277,46 @@ class Input(Component):
         if available_width <= 0:
             return [prompt]
 
-        visible_text = ""
-        cursor_display = self._cursor
+        # _value and _cursor are computed properties, so read them once
+        value = self._value
+        cursor = self._cursor
+        visible_text = value
+        cursor_display = cursor
 
-        if len(self._value) < available_width:
-            visible_text = self._value
-        else:
-            scroll_width = (
-                available_width - 1 if self._cursor == len(self._value) else available_width
-            )
+        if len(value) >= available_width:
+            scroll_width = available_width - 1 if cursor == len(value) else available_width
             half_width = scroll_width // 2
 
-            if self._cursor < half_width:
-                visible_text = self._value[:scroll_width]
-                cursor_display = self._cursor
-            elif self._cursor > len(self._value) - half_width:
-                start = len(self._value) - scroll_width
-                visible_text = self._value[start:]
-                cursor_display = self._cursor - start
+            if cursor < half_width:
+                visible_text = value[:scroll_width]
+            elif cursor > len(value) - half_width:
+                start = len(value) - scroll_width
+                visible_text = value[start:]
+                cursor_display = cursor - start
             else:
-                start = self._cursor - half_width
-                visible_text = self._value[start:start + scroll_width]
+                start = cursor - half_width
+                visible_text = value[start:start + scroll_width]
                 cursor_display = half_width
 
         before_cursor = visible_text[:cursor_display]
-        at_cursor = (
-            visible_text[cursor_display:cursor_display + 1]
-            if cursor_display < len(visible_text)
-            else " "
-        )
-        after_cursor = (
-            visible_text[cursor_display + 1 :]
-            if cursor_display + 1 < len(visible_text)
-            else ""
-        )
+        if cursor_display < len(visible_text):
+            at_cursor = visible_text[cursor_display]
+            after_cursor = visible_text[cursor_display + 1 :]
+        else:
+            at_cursor = " "
+            after_cursor = ""
 
         marker = CURSOR_MARKER if self.focused else ""
-        cursor_char = f"\x1b[7m{at_cursor}\x1b[27m"
-        text_with_cursor = before_cursor + marker + cursor_char + after_cursor
+        text_with_cursor = (
+            f"{before_cursor}{marker}{_REVERSE}{at_cursor}{_REVERSE_OFF}{after_cursor}"
+        )
 
-        visual_length = visible_width(text_with_cursor)
-        padding = " " * max(0, available_width - visual_length)
-        line = prompt + text_with_cursor + padding
+        # Printable ASCII is one column per character; the marker and the
+        # reverse-video codes take no columns
+        if visible_text.isascii() and visible_text.isprintable():
+            visual_length = len(before_cursor) + 1 + len(after_cursor)
+        else:
+            visual_length = visible_width(text_with_cursor)
+        padding = " " * (available_width - visual_length)
 
-        return [line]
+        return [prompt + text_with_cursor + padding]
@@ -39,12 +39,26 @@ class Loader(Text):
         self._message_color_fn = message_color_fn
         self._message = message
         self._current_frame = 0
+        self._frame_count = len(self.FRAMES)
+        # Display text for each frame; the color functions only run again
+        # when the message changes or the component is invalidated
+        self._frame_texts = self._build_frame_texts()
         self._task: asyncio.Task | None = None
         self._running = False
 
     def render(self, width: int) -> list[str]:
         return ["", *super().render(width)]
 
+    def invalidate(self) -> None:
+        """Clear the render cache and re-apply the color functions."""
+        super().invalidate()
+        self._frame_texts = self._build_frame_texts()
+
+    def _build_frame_texts(self) -> list[str]:
+        """Color every frame together with the current message."""
+        message = self._message_color_fn(self._message)
+        return [f"{self._spinner_color_fn(frame)} {message}" for frame in self.FRAMES]
+
     def start(self) -> None:
         """Start the loader animation."""
         if self._running:
@@ -57,7 +71,7 @@ class Loader(Text):
         """Animation loop."""
         while self._running:
             await asyncio.sleep(0.08)
-            self._current_frame = (self._current_frame + 1) % len(self.FRAMES)
+            self._current_frame = (self._current_frame + 1) % self._frame_count
             self._update_display()
 
     def stop(self) -> None:
@@ -70,11 +84,11 @@ class Loader(Text):
     def set_message(self, message: str) -> None:
         """Set the loader message."""
         self._message = message
+        self._frame_texts = self._build_frame_texts()
         self._update_display()
 
     def _update_display(self) -> None:
         """Update the display text."""
-        frame = self.FRAMES[self._current_frame]
-        self.set_text(f"{self._spinner_color_fn(frame)} {self._message_color_fn(self._message)}")
+        self.set_text(self._frame_texts[self._current_frame])
         if self._tui:
             self._tui.request_render()
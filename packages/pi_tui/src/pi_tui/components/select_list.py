@@ -6,8 +6,9 @@ TypeScript Reference: _ts_reference/components/select-list.ts
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from pi_tui.component import Component
 from pi_tui.keys import Key, matches_key
@@ -17,8 +18,18 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 
+# SGR codes used by the default theme
+_BOLD = "\x1b[1m"
+_BOLD_OFF = "\x1b[22m"
+_GRAY = "\x1b[90m"
+_FG_DEFAULT = "\x1b[39m"
+
+# Any line break (CRLF, CR or LF) in one pass
+_LINE_BREAK_RE = re.compile(r"\r\n?|\n")
+
+
 def _normalize_to_single_line(text: str) -> str:
-    return text.replace("\r\n", " ").replace("\r", " ").replace("\n", " ").strip()
+    return _LINE_BREAK_RE.sub(" ", text).strip()
 
 
 @dataclass
@@ -46,16 +57,16 @@ class DefaultSelectListTheme:
         return text
 
     def selected_text(self, text: str) -> str:
-        return f"\x1b[1m{text}\x1b[22m"
+        return f"{_BOLD}{text}{_BOLD_OFF}"
 
     def description(self, text: str) -> str:
-        return f"\x1b[90m{text}\x1b[39m"
+        return f"{_GRAY}{text}{_FG_DEFAULT}"
 
     def scroll_info(self, text: str) -> str:
-        return f"\x1b[90m{text}\x1b[39m"
+        return f"{_GRAY}{text}{_FG_DEFAULT}"
 
     def no_match(self, text: str) -> str:
-        return f"\x1b[90m{text}\x1b[39m"
+        return f"{_GRAY}{text}{_FG_DEFAULT}"
 
 
 class SelectList(Component):
@@ -72,6 +83,8 @@ class SelectList(Component):
         theme: SelectListTheme | None = None,
     ) -> None:
         self._items = items
+        # Lowercased item values, built once so filtering does not re-case them
+        self._lower_values = [item.value.lower() for item in items]
         self._filtered_items = items
         self._selected_index = 0
         self._max_visible = max_visible
@@ -81,11 +94,25 @@ class SelectList(Component):
         self.on_cancel: Callable[[], None] | None = None
         self.on_selection_change: Callable[[SelectItem], None] | None = None
 
+    def set_items(self, items: list[SelectItem]) -> None:
+        """
+        Replace the items and clear any filter.
+
+        This is the only supported way to change the items: the lowercased
+        values used by set_filter() are cached here, so mutating the list
+        passed in does not update them.
+        """
+        self._items = items
+        self._lower_values = [item.value.lower() for item in items]
+        self._filtered_items = items
+        self._selected_index = 0
+
     def set_filter(self, filter_text: str) -> None:
         """Filter items by value prefix."""
+        prefix = filter_text.lower()
         self._filtered_items = [
-            item for item in self._items
-            if item.value.lower().startswith(filter_text.lower())
+            item for item, lower_value in zip(self._items, self._lower_values, strict=True)
+            if lower_value.startswith(prefix)
         ]
         self._selected_index = 0
 
@@ -98,8 +125,10 @@ class SelectList(Component):
 
     def render(self, width: int) -> list[str]:
         lines: list[str] = []
+        items = self._filtered_items
+        count = len(items)
 
-        if not self._filtered_items:
+        if not count:
             lines.append(self._theme.no_match("  No matching commands"))
             return lines
 
@@ -107,97 +136,97 @@ class SelectList(Component):
             0,
             min(
                 self._selected_index - self._max_visible // 2,
-                len(self._filtered_items) - self._max_visible,
+                count - self._max_visible,
             ),
         )
-        end_index = min(start_index + self._max_visible, len(self._filtered_items))
+        end_index = min(start_index + self._max_visible, count)
+        # Descriptions only get a column on wide enough terminals
+        show_descriptions = width > 40
 
         for i in range(start_index, end_index):
-            item = self._filtered_items[i]
+            item = items[i]
             if not item:
                 continue
 
             is_selected = i == self._selected_index
-            description = _normalize_to_single_line(item.description) if item.description else None
-
-            if is_selected:
-                prefix_width = 2
-                display_value = item.label or item.value
+            display_value = item.label or item.value
 
-                if description and width > 40:
-                    max_value_width = min(30, width - prefix_width - 4)
-                    truncated_value = truncate_to_width(display_value, max_value_width, "")
-                    spacing = " " * max(1, 32 - len(truncated_value))
-
-                    description_start = prefix_width + len(truncated_value) + len(spacing)
-                    remaining_width = width - description_start - 2
-
-                    if remaining_width > 10:
-                        truncated_desc = truncate_to_width(description, remaining_width, "")
+            if item.description and show_descriptions:
+                description = _normalize_to_single_line(item.description)
+            else:
+                description = None
+
+            line = None
+            if description:
+                # Value column of up to 30 columns, after the two-column prefix
+                truncated_value = truncate_to_width(display_value, min(30, width - 6), "")
+                spacing = " " * max(1, 32 - len(truncated_value))
+                remaining_width = width - (2 + len(truncated_value) + len(spacing)) - 2
+
+                if remaining_width > 10:
+                    truncated_desc = truncate_to_width(description, remaining_width, "")
+                    if is_selected:
                         line = self._theme.selected_text(
                             f"→ {truncated_value}{spacing}{truncated_desc}"
                         )
                     else:
-                        max_width = width - prefix_width - 2
-                        line = self._theme.selected_text(
-                            f"→ {truncate_to_width(display_value, max_width, '')}"
-                        )
-                else:
-                    max_width = width - prefix_width - 2
-                    line = self._theme.selected_text(
-                        f"→ {truncate_to_width(display_value, max_width, '')}"
-                    )
-            else:
-                display_value = item.label or item.value
-                prefix = "  "
-
-                if description and width > 40:
-                    max_value_width = min(30, width - len(prefix) - 4)
-                    truncated_value = truncate_to_width(display_value, max_value_width, "")
-                    spacing = " " * max(1, 32 - len(truncated_value))
-
-                    description_start = len(prefix) + len(truncated_value) + len(spacing)
-                    remaining_width = width - description_start - 2
-
-                    if remaining_width > 10:
-                        truncated_desc = truncate_to_width(description, remaining_width, "")
                         desc_text = self._theme.description(spacing + truncated_desc)
-                        line = prefix + truncated_value + desc_text
-                    else:
-                        max_width = width - len(prefix) - 2
-                        line = prefix + truncate_to_width(display_value, max_width, "")
+                        line = "  " + truncated_value + desc_text
+
+            if line is None:
+                # Both row kinds have a two-column prefix and a two-column margin
+                truncated = truncate_to_width(display_value, width - 4, "")
+                if is_selected:
+                    line = self._theme.selected_text(f"→ {truncated}")
                 else:
-                    max_width = width - len(prefix) - 2
-                    line = prefix + truncate_to_width(display_value, max_width, "")
+                    line = "  " + truncated
 
             lines.append(line)
 
-        if start_index > 0 or end_index < len(self._filtered_items):
-            scroll_text = f"  ({self._selected_index + 1}/{len(self._filtered_items)})"
+        if start_index > 0 or end_index < count:
+            scroll_text = f"  ({self._selected_index + 1}/{count})"
             lines.append(self._theme.scroll_info(truncate_to_width(scroll_text, width - 2, "")))
 
         return lines
 
     def handle_input(self, data: str) -> None:
-        if matches_key(data, Key.up):
-            if self._selected_index == 0:
-                self._selected_index = len(self._filtered_items) - 1
-            else:
-                self._selected_index -= 1
-            self._notify_selection_change()
-        elif matches_key(data, Key.down):
-            if self._selected_index == len(self._filtered_items) - 1:
-                self._selected_index = 0
-            else:
-                self._selected_index += 1
-            self._notify_selection_change()
-        elif matches_key(data, Key.enter):
-            item = self._filtered_items[self._selected_index] if self._filtered_items else None
-            if item and self.on_select:
-                self.on_select(item)
-        elif matches_key(data, Key.escape):
-            if self.on_cancel:
-                self.on_cancel()
+        for key_id, handler in self._KEY_BINDINGS:
+            if matches_key(data, key_id):
+                handler(self)
+                return
+
+    def _select_previous(self) -> None:
+        if self._selected_index == 0:
+            self._selected_index = len(self._filtered_items) - 1
+        else:
+            self._selected_index -= 1
+        self._notify_selection_change()
+
+    def _select_next(self) -> None:
+        if self._selected_index == len(self._filtered_items) - 1:
+            self._selected_index = 0
+        else:
+            self._selected_index += 1
+        self._notify_selection_change()
+
+    def _confirm(self) -> None:
+        item = self._filtered_items[self._selected_index] if self._filtered_items else None
+        if item and self.on_select:
+            self.on_select(item)
+
+    def _cancel(self) -> None:
+        if self.on_cancel:
+            self.on_cancel()
+
+    # Checked in order; the first matching key wins
+    # Handlers are the plain functions defined above, called with the instance;
+    # typed Any since checkers see them as Self-bound inside the class body
+    _KEY_BINDINGS: tuple[tuple[str, Callable[[Any], None]], ...] = (
+        (Key.up, _select_previous),
+        (Key.down, _select_next),
+        (Key.enter, _confirm),
+        (Key.escape, _cancel),
+    )
 
     def _notify_selection_change(self) -> None:
         item = self._filtered_items[self._selected_index] if self._filtered_items else None
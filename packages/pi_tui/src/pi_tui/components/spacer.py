@@ -18,16 +18,21 @@ class Spacer(Component):
 
     def __init__(self, lines: int = 1) -> None:
         self._lines = lines
+        # The output never depends on width, so one list serves every render
+        self._cached: list[str] | None = None
 
     def set_lines(self, lines: int) -> None:
         """Set the number of empty lines."""
         self._lines = lines
+        self._cached = None
 
     def invalidate(self) -> None:
         pass
 
+    def is_clean(self, width: int) -> bool:
+        return self._cached is not None
+
     def render(self, width: int) -> list[str]:
-        result: list[str] = []
-        for _ in range(self._lines):
-            result.append("")
-        return result
+        if self._cached is None:
+            self._cached = [""] * self._lines
+        return self._cached
@@ -6,6 +6,7 @@ TypeScript Reference: _ts_reference/components/text.ts
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 from pi_tui.component import Component
@@ -14,6 +15,9 @@ from pi_tui.utils import apply_background_to_line, visible_width, wrap_text_with
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+# Rendered variants kept per Text, so resizing back and forth stays cached
+_RENDER_CACHE_SIZE = 4
+
 
 class Text(Component):
     """
@@ -34,44 +38,42 @@ class Text(Component):
         self._padding_y = padding_y
         self._custom_bg_fn = custom_bg_fn
 
-        self._cached_text: str | None = None
-        self._cached_width: int | None = None
-        self._cached_lines: list[str] | None = None
+        # (text, width, bg function) -> rendered lines, least recently used first
+        self._cache: OrderedDict[
+            tuple[str, int, Callable[[str], str] | None], list[str]
+        ] = OrderedDict()
+        self._last_key: tuple[str, int, Callable[[str], str] | None] | None = None
 
     def set_text(self, text: str) -> None:
         """Set the text content."""
         self._text = text
-        self._cached_text = None
-        self._cached_width = None
-        self._cached_lines = None
 
     def set_custom_bg_fn(self, custom_bg_fn: Callable[[str], str] | None) -> None:
         """Set a custom background function."""
         self._custom_bg_fn = custom_bg_fn
-        self._cached_text = None
-        self._cached_width = None
-        self._cached_lines = None
 
     def invalidate(self) -> None:
         """Clear the render cache."""
-        self._cached_text = None
-        self._cached_width = None
-        self._cached_lines = None
+        self._cache.clear()
+        self._last_key = None
+
+    def is_clean(self, width: int) -> bool:
+        """Check whether the last rendered lines are still valid for this width."""
+        key = (self._text, width, self._custom_bg_fn)
+        return self._last_key == key and key in self._cache
 
     def render(self, width: int) -> list[str]:
         """Render the text component."""
-        if (
-            self._cached_lines is not None
-            and self._cached_text == self._text
-            and self._cached_width == width
-        ):
-            return self._cached_lines
+        key = (self._text, width, self._custom_bg_fn)
+        self._last_key = key
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
 
         if not self._text or not self._text.strip():
             result: list[str] = []
-            self._cached_text = self._text
-            self._cached_width = width
-            self._cached_lines = result
+            self._store(key, result)
             return result
 
         normalized_text = self._text.replace("\t", "   ")
@@ -80,36 +82,36 @@ class Text(Component):
 
         wrapped_lines = wrap_text_with_ansi(normalized_text, content_width)
 
-        left_margin = " " * self._padding_x
-        right_margin = " " * self._padding_x
-        content_lines: list[str] = []
-
-        for line in wrapped_lines:
-            line_with_margins = left_margin + line + right_margin
-
-            if self._custom_bg_fn:
-                content_lines.append(
-                    apply_background_to_line(line_with_margins, width, self._custom_bg_fn)
-                )
-            else:
-                vis_len = visible_width(line_with_margins)
-                padding_needed = max(0, width - vis_len)
-                content_lines.append(line_with_margins + " " * padding_needed)
-
-        empty_line = " " * width
+        # Left and right margins are the same run of spaces
+        margin = " " * self._padding_x
+        lines_with_margins = [margin + line + margin for line in wrapped_lines]
+
+        bg_fn = self._custom_bg_fn
+        if bg_fn:
+            content_lines = [
+                apply_background_to_line(line, width, bg_fn) for line in lines_with_margins
+            ]
+        else:
+            # " " * n is empty for n <= 0, so lines already at width stay as-is
+            content_lines = [
+                line + " " * (width - visible_width(line)) for line in lines_with_margins
+            ]
+
+        # Every padding row is the same line, so build it once
         empty_lines: list[str] = []
-        for _ in range(self._padding_y):
+        if self._padding_y > 0:
+            empty_line = " " * width
             if self._custom_bg_fn:
-                empty_lines.append(
-                    apply_background_to_line(empty_line, width, self._custom_bg_fn)
-                )
-            else:
-                empty_lines.append(empty_line)
+                empty_line = apply_background_to_line(empty_line, width, self._custom_bg_fn)
+            empty_lines = [empty_line] * self._padding_y
 
         result = empty_lines + content_lines + empty_lines
-
-        self._cached_text = self._text
-        self._cached_width = width
-        self._cached_lines = result
+        self._store(key, result)
 
         return result if result else [""]
+
+    def _store(self, key: tuple[str, int, Callable[[str], str] | None], lines: list[str]) -> None:
+        """Cache rendered lines, evicting the least recently used entry when full."""
+        self._cache[key] = lines
+        if len(self._cache) > _RENDER_CACHE_SIZE:
+            self._cache.popitem(last=False)
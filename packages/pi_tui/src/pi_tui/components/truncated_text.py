@@ -23,45 +23,39 @@ class TruncatedText(Component):
         padding_x: int = 0,
         padding_y: int = 0,
     ) -> None:
-        self._text = text
         self._padding_x = padding_x
         self._padding_y = padding_y
+        self.set_text(text)
 
     def set_text(self, text: str) -> None:
         """Set the text content."""
         self._text = text
+        # Only the first line is shown
+        newline_index = text.find("\n")
+        self._single_line_text = text[:newline_index] if newline_index != -1 else text
+        # Printable ASCII is one column per character, even after truncation
+        self._is_plain = self._single_line_text.isascii() and self._single_line_text.isprintable()
 
     def invalidate(self) -> None:
         pass
 
     def render(self, width: int) -> list[str]:
-        result: list[str] = []
-
-        empty_line = " " * width
-
-        for _ in range(self._padding_y):
-            result.append(empty_line)
-
         available_width = max(1, width - self._padding_x * 2)
 
-        single_line_text = self._text
-        newline_index = self._text.find("\n")
-        if newline_index != -1:
-            single_line_text = self._text[:newline_index]
-
-        display_text = truncate_to_width(single_line_text, available_width)
-
-        left_padding = " " * self._padding_x
-        right_padding = " " * self._padding_x
-        line_with_padding = left_padding + display_text + right_padding
+        display_text = truncate_to_width(self._single_line_text, available_width)
 
-        line_visible_width = visible_width(line_with_padding)
-        padding_needed = max(0, width - line_visible_width)
-        final_line = line_with_padding + " " * padding_needed
+        # Left and right padding are the same run of spaces
+        padding = " " * self._padding_x
+        line_with_padding = padding + display_text + padding
 
-        result.append(final_line)
+        if self._is_plain:
+            line_visible_width = len(line_with_padding)
+        else:
+            line_visible_width = visible_width(line_with_padding)
+        final_line = line_with_padding + " " * (width - line_visible_width)
 
-        for _ in range(self._padding_y):
-            result.append(empty_line)
+        if self._padding_y <= 0:
+            return [final_line]
 
-        return result
+        empty_rows = [" " * width] * self._padding_y
+        return empty_rows + [final_line] + empty_rows
@@ -21,8 +21,11 @@ class Container implements Component {
 from __future__ import annotations
 
 import contextlib
+from itertools import chain
 from typing import TYPE_CHECKING
 
+from pi_tui.component import is_render_clean
+
 if TYPE_CHECKING:
     from pi_tui.component import Component
 
@@ -38,6 +41,11 @@ class Container:
 
     def __init__(self) -> None:
         self.children = []
+        # Children and their lines from the last render, in child order,
+        # and the width it was rendered at
+        self._rendered_children: list[Component] = []
+        self._rendered_parts: list[list[str]] = []
+        self._render_width: int | None = None
 
     def add_child(self, component: Component) -> None:
         """Add a child component."""
@@ -54,9 +62,25 @@ class Container:
 
     def invalidate(self) -> None:
         """Invalidate all child components."""
+        self._rendered_children = []
+        self._rendered_parts = []
         for child in self.children:
             child.invalidate()
 
+    def is_clean(self, width: int) -> bool:
+        """Check whether the last render is still valid for this width."""
+        if width != self._render_width:
+            return False
+        rendered = self._rendered_children
+        children = self.children
+        return (
+            len(rendered) == len(children)
+            and all(
+                previous is child and is_render_clean(child, width)
+                for previous, child in zip(rendered, children, strict=True)
+            )
+        )
+
     def render(self, width: int) -> list[str]:
         """
         Render all children to lines.
@@ -67,7 +91,28 @@ class Container:
         Returns:
             Combined lines from all children
         """
-        lines: list[str] = []
-        for child in self.children:
-            lines.extend(child.render(width))
-        return lines
+        children = self.children
+        previous_children: list[Component] = []
+        previous_parts: list[list[str]] = []
+        if width == self._render_width:
+            previous_children = self._rendered_children
+            previous_parts = self._rendered_parts
+
+        parts: list[list[str]] = []
+        for i, child in enumerate(children):
+            # Reuse the last output of a child that is still in the same slot
+            # and reports nothing changed
+            if (
+                i < len(previous_children)
+                and previous_children[i] is child
+                and is_render_clean(child, width)
+            ):
+                parts.append(previous_parts[i])
+            else:
+                parts.append(child.render(width))
+
+        self._rendered_children = list(children)
+        self._rendered_parts = parts
+        self._render_width = width
+        # One C-level concatenation instead of an extend() per child
+        return list(chain.from_iterable(parts))
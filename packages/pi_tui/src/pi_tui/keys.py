@@ -18,7 +18,11 @@ API:
 from __future__ import annotations
 
 import re
-from typing import Literal, TypedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Literal, NamedTuple, TypedDict
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 # =============================================================================
 # Type Definitions
@@ -195,6 +199,8 @@ SYMBOL_KEYS = {
     "_", "+", "|", "~", "{", "}", ":", "<", ">", "?",
 }
 
+_SYMBOL_CODEPOINTS = frozenset(ord(symbol) for symbol in SYMBOL_KEYS)
+
 MODIFIERS = {
     "shift": 1,
     "alt": 2,
@@ -228,59 +234,76 @@ FUNCTIONAL_CODEPOINTS = {
     "end": -15,
 }
 
+# Codepoint -> base key name reported by parse_key(): arrows, functional keys,
+# printable ASCII (lowercased) and F1-F12 (Kitty codepoints 57344-57355)
+_CODEPOINT_KEY_NAMES: dict[int, str] = {
+    **{code: name for name, code in ARROW_CODEPOINTS.items()},
+    **{code: name for name, code in FUNCTIONAL_CODEPOINTS.items()},
+    **{code: chr(code).lower() for code in range(32, 127)},
+    **{57343 + num: f"f{num}" for num in range(1, 13)},
+}
+
 # Legacy key sequences (common terminal escape sequences)
-LEGACY_KEY_SEQUENCES: dict[str, list[str]] = {
-    "up": ["\x1b[A", "\x1bOA"],
-    "down": ["\x1b[B", "\x1bOB"],
-    "right": ["\x1b[C", "\x1bOC"],
-    "left": ["\x1b[D", "\x1bOD"],
-    "home": ["\x1b[H", "\x1bOH", "\x1b[1~", "\x1b[7~"],
-    "end": ["\x1b[F", "\x1bOF", "\x1b[4~", "\x1b[8~"],
-    "insert": ["\x1b[2~"],
-    "delete": ["\x1b[3~"],
-    "pageUp": ["\x1b[5~", "\x1b[[5~"],
-    "pageDown": ["\x1b[6~", "\x1b[[6~"],
-    "clear": ["\x1b[E", "\x1bOE"],
-    "f1": ["\x1bOP", "\x1b[11~", "\x1b[[A"],
-    "f2": ["\x1bOQ", "\x1b[12~", "\x1b[[B"],
-    "f3": ["\x1bOR", "\x1b[13~", "\x1b[[C"],
-    "f4": ["\x1bOS", "\x1b[14~", "\x1b[[D"],
-    "f5": ["\x1b[15~", "\x1b[[E"],
-    "f6": ["\x1b[17~"],
-    "f7": ["\x1b[18~"],
-    "f8": ["\x1b[19~"],
-    "f9": ["\x1b[20~"],
-    "f10": ["\x1b[21~"],
-    "f11": ["\x1b[23~"],
-    "f12": ["\x1b[24~"],
+LEGACY_KEY_SEQUENCES: dict[str, frozenset[str]] = {
+    "up": frozenset({"\x1b[A", "\x1bOA"}),
+    "down": frozenset({"\x1b[B", "\x1bOB"}),
+    "right": frozenset({"\x1b[C", "\x1bOC"}),
+    "left": frozenset({"\x1b[D", "\x1bOD"}),
+    "home": frozenset({"\x1b[H", "\x1bOH", "\x1b[1~", "\x1b[7~"}),
+    "end": frozenset({"\x1b[F", "\x1bOF", "\x1b[4~", "\x1b[8~"}),
+    "insert": frozenset({"\x1b[2~"}),
+    "delete": frozenset({"\x1b[3~"}),
+    "pageUp": frozenset({"\x1b[5~", "\x1b[[5~"}),
+    "pageDown": frozenset({"\x1b[6~", "\x1b[[6~"}),
+    "clear": frozenset({"\x1b[E", "\x1bOE"}),
+    "f1": frozenset({"\x1bOP", "\x1b[11~", "\x1b[[A"}),
+    "f2": frozenset({"\x1bOQ", "\x1b[12~", "\x1b[[B"}),
+    "f3": frozenset({"\x1bOR", "\x1b[13~", "\x1b[[C"}),
+    "f4": frozenset({"\x1bOS", "\x1b[14~", "\x1b[[D"}),
+    "f5": frozenset({"\x1b[15~", "\x1b[[E"}),
+    "f6": frozenset({"\x1b[17~"}),
+    "f7": frozenset({"\x1b[18~"}),
+    "f8": frozenset({"\x1b[19~"}),
+    "f9": frozenset({"\x1b[20~"}),
+    "f10": frozenset({"\x1b[21~"}),
+    "f11": frozenset({"\x1b[23~"}),
+    "f12": frozenset({"\x1b[24~"}),
 }
 
-LEGACY_SHIFT_SEQUENCES: dict[str, list[str]] = {
-    "up": ["\x1b[a"],
-    "down": ["\x1b[b"],
-    "right": ["\x1b[c"],
-    "left": ["\x1b[d"],
-    "clear": ["\x1b[e"],
-    "insert": ["\x1b[2$"],
-    "delete": ["\x1b[3$"],
-    "pageUp": ["\x1b[5$"],
-    "pageDown": ["\x1b[6$"],
-    "home": ["\x1b[7$"],
-    "end": ["\x1b[8$"],
+LEGACY_SHIFT_SEQUENCES: dict[str, frozenset[str]] = {
+    "up": frozenset({"\x1b[a"}),
+    "down": frozenset({"\x1b[b"}),
+    "right": frozenset({"\x1b[c"}),
+    "left": frozenset({"\x1b[d"}),
+    "clear": frozenset({"\x1b[e"}),
+    "insert": frozenset({"\x1b[2$"}),
+    "delete": frozenset({"\x1b[3$"}),
+    "pageUp": frozenset({"\x1b[5$"}),
+    "pageDown": frozenset({"\x1b[6$"}),
+    "home": frozenset({"\x1b[7$"}),
+    "end": frozenset({"\x1b[8$"}),
 }
 
-LEGACY_CTRL_SEQUENCES: dict[str, list[str]] = {
-    "up": ["\x1bOa"],
-    "down": ["\x1bOb"],
-    "right": ["\x1bOc"],
-    "left": ["\x1bOd"],
-    "clear": ["\x1bOe"],
-    "insert": ["\x1b[2^"],
-    "delete": ["\x1b[3^"],
-    "pageUp": ["\x1b[5^"],
-    "pageDown": ["\x1b[6^"],
-    "home": ["\x1b[7^"],
-    "end": ["\x1b[8^"],
+LEGACY_CTRL_SEQUENCES: dict[str, frozenset[str]] = {
+    "up": frozenset({"\x1bOa"}),
+    "down": frozenset({"\x1bOb"}),
+    "right": frozenset({"\x1bOc"}),
+    "left": frozenset({"\x1bOd"}),
+    "clear": frozenset({"\x1bOe"}),
+    "insert": frozenset({"\x1b[2^"}),
+    "delete": frozenset({"\x1b[3^"}),
+    "pageUp": frozenset({"\x1b[5^"}),
+    "pageDown": frozenset({"\x1b[6^"}),
+    "home": frozenset({"\x1b[7^"}),
+    "end": frozenset({"\x1b[8^"}),
+}
+
+_NO_SEQUENCES: frozenset[str] = frozenset()
+
+# (key, modifier) -> legacy sequences for shift/ctrl-modified keys
+_LEGACY_MODIFIER_SEQUENCES: dict[tuple[str, int], frozenset[str]] = {
+    **{(key, MODIFIERS["shift"]): seqs for key, seqs in LEGACY_SHIFT_SEQUENCES.items()},
+    **{(key, MODIFIERS["ctrl"]): seqs for key, seqs in LEGACY_CTRL_SEQUENCES.items()},
 }
 
 # Direct mapping of sequences to key IDs
@@ -350,29 +373,21 @@ LEGACY_SEQUENCE_KEY_IDS: dict[str, str] = {
 # Legacy Sequence Matching
 # =============================================================================
 
-def _matches_legacy_sequence(data: str, sequences: list[str]) -> bool:
+def _matches_legacy_sequence(data: str, sequences: frozenset[str]) -> bool:
     """Check if data matches any of the legacy sequences."""
     return data in sequences
 
 
 def _matches_legacy_modifier_sequence(data: str, key: str, modifier: int) -> bool:
     """Check if data matches a legacy sequence with modifier."""
-    if modifier == MODIFIERS["shift"]:
-        return key in LEGACY_SHIFT_SEQUENCES and _matches_legacy_sequence(
-            data, LEGACY_SHIFT_SEQUENCES[key]
-        )
-    if modifier == MODIFIERS["ctrl"]:
-        return key in LEGACY_CTRL_SEQUENCES and _matches_legacy_sequence(
-            data, LEGACY_CTRL_SEQUENCES[key]
-        )
-    return False
+    return data in _LEGACY_MODIFIER_SEQUENCES.get((key, modifier), _NO_SEQUENCES)
 
 
 # =============================================================================
 # Kitty Protocol Parsing
 # =============================================================================
 
-class ParsedKittySequence(TypedDict):
+class ParsedKittySequence(NamedTuple):
     """Parsed Kitty keyboard protocol sequence."""
     codepoint: int
     shifted_key: int | None
@@ -381,7 +396,35 @@ class ParsedKittySequence(TypedDict):
     event_type: str
 
 
-_last_event_type: str = "press"
+# CSI u: \x1b[<codepoint>[:<shifted>[:<base>]][;<mod>[:<event>]]u
+_CSI_U_RE = re.compile(r"^\x1b\[(\d+)(?::(\d*))?(?::(\d+))?(?:;(\d+))?(?::(\d+))?u$")
+# Arrow, Home and End keys with modifier: \x1b[1;<mod>[:<event>]A/B/C/D/H/F
+_MODIFIED_NAV_RE = re.compile(r"^\x1b\[1;(\d+)(?::(\d+))?([ABCDHF])$")
+# Functional keys: \x1b[<num>[;<mod>][:<event>]~
+_FUNC_RE = re.compile(r"^\x1b\[(\d+)(?:;(\d+))?(?::(\d+))?~$")
+# xterm modifyOtherKeys: \x1b[27;<mod>;<keycode>~
+_MOKEYS_RE = re.compile(r"^\x1b\[27;(\d+);(\d+)~$")
+
+# Kitty event type 3 (release) / 2 (repeat) right before a sequence terminator
+_RELEASE_RE = re.compile(r":3[uABCDHF~]")
+_REPEAT_RE = re.compile(r":2[uABCDHF~]")
+
+_MODIFIED_NAV_CODES = {
+    "A": -1,
+    "B": -2,
+    "C": -3,
+    "D": -4,
+    "H": FUNCTIONAL_CODEPOINTS["home"],
+    "F": FUNCTIONAL_CODEPOINTS["end"],
+}
+_FUNC_CODES = {
+    2: FUNCTIONAL_CODEPOINTS["insert"],
+    3: FUNCTIONAL_CODEPOINTS["delete"],
+    5: FUNCTIONAL_CODEPOINTS["pageUp"],
+    6: FUNCTIONAL_CODEPOINTS["pageDown"],
+    7: FUNCTIONAL_CODEPOINTS["home"],
+    8: FUNCTIONAL_CODEPOINTS["end"],
+}
 
 
 def is_key_release(data: str) -> bool:
@@ -391,10 +434,7 @@ def is_key_release(data: str) -> bool:
     """
     if "\x1b[200~" in data:  # Bracketed paste
         return False
-    return any(
-        f":{t}" in data
-        for t in ["3u", "3~", "3A", "3B", "3C", "3D", "3H", "3F"]
-    )
+    return _RELEASE_RE.search(data) is not None
 
 
 def is_key_repeat(data: str) -> bool:
@@ -404,10 +444,7 @@ def is_key_repeat(data: str) -> bool:
     """
     if "\x1b[200~" in data:  # Bracketed paste
         return False
-    return any(
-        f":{t}" in data
-        for t in ["2u", "2~", "2A", "2B", "2C", "2D", "2H", "2F"]
-    )
+    return _REPEAT_RE.search(data) is not None
 
 
 def _parse_event_type(event_type_str: str | None) -> str:
@@ -425,6 +462,11 @@ def _parse_event_type(event_type_str: str | None) -> str:
     return "press"
 
 
+# Terminals resend the same few sequences constantly; long input such as a
+# bracketed paste is parsed without the cache so it is not kept alive.
+_KITTY_CACHE_MAX_DATA_LEN = 32
+
+
 def _parse_kitty_sequence(data: str) -> ParsedKittySequence | None:
     """
     Parse a Kitty keyboard protocol sequence.
@@ -436,109 +478,94 @@ def _parse_kitty_sequence(data: str) -> ParsedKittySequence | None:
     - \x1b[<codepoint>:<shifted>;<mod>u
     - \x1b[<codepoint>:<shifted>:<base>;<mod>u
     """
-    global _last_event_type
-
-    # CSI u format
-    csi_u_match = re.match(
-        r"^\x1b\[(\d+)(?::(\d*))?(?::(\d+))?(?:;(\d+))?(?::(\d+))?u$",
-        data
-    )
-    if csi_u_match:
-        codepoint = int(csi_u_match.group(1))
-        shifted_key = int(csi_u_match.group(2)) if csi_u_match.group(2) else None
-        base_layout_key = int(csi_u_match.group(3)) if csi_u_match.group(3) else None
-        mod_value = int(csi_u_match.group(4)) if csi_u_match.group(4) else 1
-        event_type = _parse_event_type(csi_u_match.group(5))
-        _last_event_type = event_type
-        return ParsedKittySequence(
-            codepoint=codepoint,
-            shifted_key=shifted_key,
-            base_layout_key=base_layout_key,
-            modifier=mod_value - 1,
-            event_type=event_type,
-        )
-
-    # Arrow keys with modifier: \x1b[1;<mod>A/B/C/D
-    arrow_match = re.match(r"^\x1b\[1;(\d+)(?::(\d+))?([ABCD])$", data)
-    if arrow_match:
-        mod_value = int(arrow_match.group(1))
-        event_type = _parse_event_type(arrow_match.group(2))
-        arrow_codes = {"A": -1, "B": -2, "C": -3, "D": -4}
-        _last_event_type = event_type
-        return ParsedKittySequence(
-            codepoint=arrow_codes[arrow_match.group(3)],
-            shifted_key=None,
-            base_layout_key=None,
-            modifier=mod_value - 1,
-            event_type=event_type,
-        )
+    if not data.startswith("\x1b["):
+        return None
+    if len(data) > _KITTY_CACHE_MAX_DATA_LEN:
+        return _parse_csi_sequence(data)
+    return _parse_csi_sequence_cached(data)
+
+
+def _parse_csi_sequence(data: str) -> ParsedKittySequence | None:
+    """Parse data that starts with CSI as one of the Kitty key formats."""
+    # Each format is identified by its final byte, so only one pattern needs
+    # to be tried. The patterns end in $, which also accepts one trailing
+    # newline, so look past it.
+    last = data[-1]
+    if last == "\n":
+        last = data[-2]
+
+    if last == "u":
+        csi_u_match = _CSI_U_RE.match(data)
+        if csi_u_match:
+            codepoint = int(csi_u_match.group(1))
+            shifted_key = int(csi_u_match.group(2)) if csi_u_match.group(2) else None
+            base_layout_key = int(csi_u_match.group(3)) if csi_u_match.group(3) else None
+            mod_value = int(csi_u_match.group(4)) if csi_u_match.group(4) else 1
+            event_type = _parse_event_type(csi_u_match.group(5))
+            return ParsedKittySequence(
+                codepoint=codepoint,
+                shifted_key=shifted_key,
+                base_layout_key=base_layout_key,
+                modifier=mod_value - 1,
+                event_type=event_type,
+            )
 
-    # Functional keys: \x1b[<num>~ or \x1b[<num>;<mod>~
-    func_match = re.match(r"^\x1b\[(\d+)(?:;(\d+))?(?::(\d+))?~$", data)
-    if func_match:
-        key_num = int(func_match.group(1))
-        mod_value = int(func_match.group(2)) if func_match.group(2) else 1
-        event_type = _parse_event_type(func_match.group(3))
-        func_codes = {
-            2: FUNCTIONAL_CODEPOINTS["insert"],
-            3: FUNCTIONAL_CODEPOINTS["delete"],
-            5: FUNCTIONAL_CODEPOINTS["pageUp"],
-            6: FUNCTIONAL_CODEPOINTS["pageDown"],
-            7: FUNCTIONAL_CODEPOINTS["home"],
-            8: FUNCTIONAL_CODEPOINTS["end"],
-        }
-        if key_num in func_codes:
-            _last_event_type = event_type
+    elif last in _MODIFIED_NAV_CODES:
+        # Arrow, Home and End keys with modifier: \x1b[1;<mod>A/B/C/D/H/F
+        nav_match = _MODIFIED_NAV_RE.match(data)
+        if nav_match:
+            mod_value = int(nav_match.group(1))
+            event_type = _parse_event_type(nav_match.group(2))
             return ParsedKittySequence(
-                codepoint=func_codes[key_num],
+                codepoint=_MODIFIED_NAV_CODES[nav_match.group(3)],
                 shifted_key=None,
                 base_layout_key=None,
                 modifier=mod_value - 1,
                 event_type=event_type,
             )
 
-    # Home/End with modifier: \x1b[1;<mod>H/F
-    home_end_match = re.match(r"^\x1b\[1;(\d+)(?::(\d+))?([HF])$", data)
-    if home_end_match:
-        mod_value = int(home_end_match.group(1))
-        event_type = _parse_event_type(home_end_match.group(2))
-        codepoint = (
-            FUNCTIONAL_CODEPOINTS["home"]
-            if home_end_match.group(3) == "H"
-            else FUNCTIONAL_CODEPOINTS["end"]
-        )
-        _last_event_type = event_type
-        return ParsedKittySequence(
-            codepoint=codepoint,
-            shifted_key=None,
-            base_layout_key=None,
-            modifier=mod_value - 1,
-            event_type=event_type,
-        )
+    elif last == "~":
+        # Functional keys: \x1b[<num>~ or \x1b[<num>;<mod>~
+        func_match = _FUNC_RE.match(data)
+        if func_match:
+            key_num = int(func_match.group(1))
+            mod_value = int(func_match.group(2)) if func_match.group(2) else 1
+            event_type = _parse_event_type(func_match.group(3))
+            if key_num in _FUNC_CODES:
+                return ParsedKittySequence(
+                    codepoint=_FUNC_CODES[key_num],
+                    shifted_key=None,
+                    base_layout_key=None,
+                    modifier=mod_value - 1,
+                    event_type=event_type,
+                )
 
     return None
 
 
+_parse_csi_sequence_cached = lru_cache(maxsize=512)(_parse_csi_sequence)
+
+
 def _matches_kitty_sequence(data: str, expected_codepoint: int, expected_modifier: int) -> bool:
     """Check if data matches a Kitty sequence for the expected key and modifier."""
     parsed = _parse_kitty_sequence(data)
     if not parsed:
         return False
 
-    actual_mod = parsed["modifier"] & ~LOCK_MASK
+    actual_mod = parsed.modifier & ~LOCK_MASK
     expected_mod = expected_modifier & ~LOCK_MASK
 
     if actual_mod != expected_mod:
         return False
 
-    if parsed["codepoint"] == expected_codepoint:
+    if parsed.codepoint == expected_codepoint:
         return True
 
     # Alternate match using base layout key for non-Latin layouts
-    if parsed["base_layout_key"] is not None and parsed["base_layout_key"] == expected_codepoint:
-        cp = parsed["codepoint"]
+    if parsed.base_layout_key is not None and parsed.base_layout_key == expected_codepoint:
+        cp = parsed.codepoint
         is_latin_letter = 97 <= cp <= 122  # a-z
-        is_known_symbol = chr(cp) in SYMBOL_KEYS
+        is_known_symbol = cp in _SYMBOL_CODEPOINTS
         if not is_latin_letter and not is_known_symbol:
             return True
 
@@ -547,7 +574,7 @@ def _matches_kitty_sequence(data: str, expected_codepoint: int, expected_modifie
 
 def _matches_modify_other_keys(data: str, expected_keycode: int, expected_modifier: int) -> bool:
     """Match xterm modifyOtherKeys format: CSI 27 ; modifiers ; keycode ~"""
-    match = re.match(r"^\x1b\[27;(\d+);(\d+)~$", data)
+    match = _MOKEYS_RE.match(data)
     if not match:
         return False
     mod_value = int(match.group(1))
@@ -560,29 +587,303 @@ def _matches_modify_other_keys(data: str, expected_keycode: int, expected_modifi
 # Key Parsing
 # =============================================================================
 
+# Key (either letter case) -> control character sent for Ctrl+key
+_RAW_CTRL_CHARS: dict[str, str] = {
+    **{char: chr(ord(char) & 0x1F) for char in "abcdefghijklmnopqrstuvwxyz[\\]_"},
+    **{char: chr(ord(char) & 0x1F) for char in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+    "-": chr(31),  # Same as Ctrl+_
+}
+
+
 def _raw_ctrl_char(key: str) -> str | None:
     """Get the control character for a key."""
-    char = key.lower()
-    code = ord(char)
-    if (97 <= code <= 122) or char in "[\\]_":
-        return chr(code & 0x1F)
-    if char == "-":
-        return chr(31)  # Same as Ctrl+_
-    return None
+    return _RAW_CTRL_CHARS.get(key)
+
 
+@lru_cache(maxsize=256)
+def _parse_key_id(key_id: str) -> tuple[str, bool, bool, bool, int] | None:
+    """
+    Parse a key identifier into (key, ctrl, shift, alt, modifier).
 
-def _parse_key_id(key_id: str) -> dict | None:
-    """Parse a key identifier into its components."""
+    The modifier is the Kitty bitmask for the named modifiers. Results are
+    cached since applications match against a small, fixed set of key ids.
+    """
     parts = key_id.lower().split("+")
     key = parts[-1]
     if not key:
         return None
-    return {
-        "key": key,
-        "ctrl": "ctrl" in parts,
-        "shift": "shift" in parts,
-        "alt": "alt" in parts,
-    }
+    ctrl = "ctrl" in parts
+    shift = "shift" in parts
+    alt = "alt" in parts
+
+    modifier = 0
+    if shift:
+        modifier |= MODIFIERS["shift"]
+    if alt:
+        modifier |= MODIFIERS["alt"]
+    if ctrl:
+        modifier |= MODIFIERS["ctrl"]
+    return key, ctrl, shift, alt, modifier
+
+
+# =============================================================================
+# Per-key Matchers
+# =============================================================================
+# Each matcher receives the raw input, the lowercased base key from the key id
+# and its modifiers; matches_key() picks one from _MATCHERS by base key.
+
+def _match_escape(
+    data: str, key: str, modifier: int, ctrl: bool, shift: bool, alt: bool
+) -> bool:
+    if modifier != 0:
+        return False
+    return data == "\x1b" or _matches_kitty_sequence(data, CODEPOINTS["escape"], 0)
+
+
+def _match_space(
+    data: str, key: str, modifier: int, ctrl: bool, shift: bool, alt: bool
+) -> bool:
+    if not _kitty_protocol_active:
+        if ctrl and not alt and not shift and data == "\x00":
+            return True
+        if alt and not ctrl and not shift and data == "\x1b ":
+            return True
+    if modifier == 0:
+        return data == " " or _matches_kitty_sequence(data, CODEPOINTS["space"], 0)
+    return _matches_kitty_sequence(data, CODEPOINTS["space"], modifier)
+
+
+def _match_tab(
+    data: str, key: str, modifier: int, ctrl: bool, shift: bool, alt: bool
+) -> bool:
+    if shift and not ctrl and not alt:
+        return (
+            data == "\x1b[Z"
+            or _matches_kitty_sequence(data, CODEPOINTS["tab"], MODIFIERS["shift"])
+        )
+    if modifier == 0:
+        return data == "\t" or _matches_kitty_sequence(data, CODEPOINTS["tab"], 0)
+    return _matches_kitty_sequence(data, CODEPOINTS["tab"], modifier)
+
+
+def _match_enter(
+    data: str, key: str, modifier: int, ctrl: bool, shift: bool, alt: bool
+) -> bool:
+    if shift and not ctrl and not alt:
+        if _matches_kitty_sequence(data, CODEPOINTS["enter"], MODIFIERS["shift"]):
+            return True
+        if _matches_kitty_sequence(data, CODEPOINTS["kp_enter"], MODIFIERS["shift"]):
+            return True
+        if _matches_modify_other_keys(data, CODEPOINTS["enter"], MODIFIERS["shift"]):
+            return True
+        if _kitty_protocol_active:
+            return data == "\x1b\r" or data == "\n"
+        return False
+    if alt and not ctrl and not shift:
+        if _matches_kitty_sequence(data, CODEPOINTS["enter"], MODIFIERS["alt"]):
+            return True
+        if _matches_kitty_sequence(data, CODEPOINTS["kp_enter"], MODIFIERS["alt"]):
+            return True
+        if _matches_modify_other_keys(data, CODEPOINTS["enter"], MODIFIERS["alt"]):
+            return True
+        if not _kitty_protocol_active:
+            return data == "\x1b\r"
+        return False
+    if modifier == 0:
+        return (
+            data == "\r"
+            or (not _kitty_protocol_active and data == "\n")
+            or data == "\x1bOM"
+            or _matches_kitty_sequence(data, CODEPOINTS["enter"], 0)
+            or _matches_kitty_sequence(data, CODEPOINTS["kp_enter"], 0)
+        )
+    return (
+        _matches_kitty_sequence(data, CODEPOINTS["enter"], modifier)
+        or _matches_kitty_sequence(data, CODEPOINTS["kp_enter"], modifier)
+    )
+
+
+def _match_backspace(
+    data: str, key: str, modifier: int, ctrl: bool, shift: bool, alt: bool
+) -> bool:
+    if alt and not ctrl and not shift:
+        if data in ("\x1b\x7f", "\x1b\b"):
+            return True
+        return _matches_kitty_sequence(data, CODEPOINTS["backspace"], MODIFIERS["alt"])
+    if modifier == 0:
+        return (
+            data in ("\x7f", "\x08")
+            or _matches_kitty_sequence(data, CODEPOINTS["backspace"], 0)
+        )
+    return _matches_kitty_sequence(data, CODEPOINTS["backspace"], modifier)
+
+
+def _match_functional(
+    data: str, key: str, modifier: int, ctrl: bool, shift: bool, alt: bool
+) -> bool:
+    """Match insert, delete, home, end, pageup and pagedown."""
+    key_map = {"pageup": "pageUp", "pagedown": "pageDown"}
+    legacy_key = key_map.get(key, key)
+    legacy_sequences = LEGACY_KEY_SEQUENCES.get(legacy_key, _NO_SEQUENCES)
+    cp = FUNCTIONAL_CODEPOINTS.get(legacy_key)
+
+    if modifier == 0:
+        if _matches_legacy_sequence(data, legacy_sequences):
+            return True
+        return bool(cp and _matches_kitty_sequence(data, cp, 0))
+
+    if _matches_legacy_modifier_sequence(data, legacy_key, modifier):
+        return True
+    if cp:
+        return _matches_kitty_sequence(data, cp, modifier)
+    return False
+
+
+def _match_arrow(
+    data: str, key: str, modifier: int, ctrl: bool, shift: bool, alt: bool
+) -> bool:
+    legacy_sequences = LEGACY_KEY_SEQUENCES.get(key, _NO_SEQUENCES)
+    cp = ARROW_CODEPOINTS[key]
+
+    # Alt variations
+    if alt and not ctrl and not shift:
+        if key == "up":
+            return data == "\x1bp" or _matches_kitty_sequence(data, cp, MODIFIERS["alt"])
+        if key == "down":
+            return data == "\x1bn" or _matches_kitty_sequence(data, cp, MODIFIERS["alt"])
+        if key == "left":
+            return (
+                data == "\x1b[1;3D"
+                or (not _kitty_protocol_active and data == "\x1bB")
+                or data == "\x1bb"
+                or _matches_kitty_sequence(data, cp, MODIFIERS["alt"])
+            )
+        if key == "right":
+            return (
+                data == "\x1b[1;3C"
+                or (not _kitty_protocol_active and data == "\x1bF")
+                or data == "\x1bf"
+                or _matches_kitty_sequence(data, cp, MODIFIERS["alt"])
+            )
+
+    # Ctrl variations
+    if ctrl and not alt and not shift and key == "left":
+        return (
+            data == "\x1b[1;5D"
+            or _matches_legacy_modifier_sequence(data, "left", MODIFIERS["ctrl"])
+            or _matches_kitty_sequence(data, cp, MODIFIERS["ctrl"])
+        )
+
+    if ctrl and not alt and not shift and key == "right":
+        return (
+            data == "\x1b[1;5C"
+            or _matches_legacy_modifier_sequence(data, "right", MODIFIERS["ctrl"])
+            or _matches_kitty_sequence(data, cp, MODIFIERS["ctrl"])
+        )
+
+    if modifier == 0:
+        return (
+            _matches_legacy_sequence(data, legacy_sequences)
+            or _matches_kitty_sequence(data, cp, 0)
+        )
+
+    if _matches_legacy_modifier_sequence(data, key, modifier):
+        return True
+    return _matches_kitty_sequence(data, cp, modifier)
+
+
+def _match_function_key(
+    data: str, key: str, modifier: int, ctrl: bool, shift: bool, alt: bool
+) -> bool:
+    """Match F1-F12."""
+    if modifier == 0:
+        return _matches_legacy_sequence(data, LEGACY_KEY_SEQUENCES[key])
+    return False  # Function keys with modifiers not fully implemented
+
+
+def _match_clear(
+    data: str, key: str, modifier: int, ctrl: bool, shift: bool, alt: bool
+) -> bool:
+    if modifier == 0:
+        return _matches_legacy_sequence(data, LEGACY_KEY_SEQUENCES["clear"])
+    return _matches_legacy_modifier_sequence(data, "clear", modifier)
+
+
+def _match_letter(
+    data: str, key: str, modifier: int, ctrl: bool, shift: bool, alt: bool
+) -> bool:
+    char_code = ord(key)
+
+    # Ctrl combinations
+    if ctrl and not alt and not shift:
+        ctrl_char = _raw_ctrl_char(key)
+        if ctrl_char and data == ctrl_char:
+            return True
+        return _matches_kitty_sequence(data, char_code, MODIFIERS["ctrl"])
+
+    # Alt combinations
+    if alt and not ctrl and not shift:
+        if data == f"\x1b{key}" or data == f"\x1b{key.upper()}":
+            return True
+        return _matches_kitty_sequence(data, char_code, MODIFIERS["alt"])
+
+    # No modifier
+    if modifier == 0:
+        return data == key or data == key.upper()
+
+    # Other combinations via Kitty protocol
+    return _matches_kitty_sequence(data, char_code, modifier)
+
+
+def _match_symbol(
+    data: str, key: str, modifier: int, ctrl: bool, shift: bool, alt: bool
+) -> bool:
+    char_code = ord(key)
+
+    if ctrl and not alt and not shift:
+        ctrl_char = _raw_ctrl_char(key)
+        if ctrl_char and data == ctrl_char:
+            return True
+
+    if modifier == 0:
+        return data == key
+
+    return _matches_kitty_sequence(data, char_code, modifier)
+
+
+# Base key (lowercased, as produced by _parse_key_id) -> matcher
+_MATCHERS: dict[str, Callable[[str, str, int, bool, bool, bool], bool]] = {
+    "escape": _match_escape,
+    "esc": _match_escape,
+    "space": _match_space,
+    "tab": _match_tab,
+    "enter": _match_enter,
+    "return": _match_enter,
+    "backspace": _match_backspace,
+    "clear": _match_clear,
+    **dict.fromkeys(
+        ("insert", "delete", "home", "end", "pageup", "pagedown"), _match_functional
+    ),
+    **dict.fromkeys(ARROW_CODEPOINTS, _match_arrow),
+    **dict.fromkeys(
+        (name for name in LEGACY_KEY_SEQUENCES if name[0] == "f" and name[1:].isdigit()),
+        _match_function_key,
+    ),
+    **dict.fromkeys("abcdefghijklmnopqrstuvwxyz", _match_letter),
+    **dict.fromkeys(SYMBOL_KEYS, _match_symbol),
+}
+
+
+# Fixed legacy sequence -> parsed form of the key id parse_key() reports for it
+_LEGACY_SEQUENCE_KEYS = {
+    sequence: _parse_key_id(key_id) for sequence, key_id in LEGACY_SEQUENCE_KEY_IDS.items()
+}
+
+# Results of matches_key() per (data, key_id, Kitty protocol state); cleared
+# wholesale once full. Only short inputs are cached so pastes stay out.
+_MATCH_CACHE: dict[tuple[str, str, bool], bool] = {}
+_MATCH_CACHE_SIZE = 1024
+_MATCH_CACHE_MAX_DATA_LEN = 32
 
 
 def matches_key(data: str, key_id: KeyId) -> bool:
@@ -608,223 +909,77 @@ def matches_key(data: str, key_id: KeyId) -> bool:
     Returns:
         True if the input matches the key identifier
     """
-    parsed = _parse_key_id(key_id)
-    if not parsed:
+    # Every multi-character input a key can produce starts with ESC, apart
+    # from the uppercase form of a letter (at most three characters, e.g. "SS")
+    if len(data) > 3 and data[0] != "\x1b":
         return False
 
-    key = parsed["key"]  # type: ignore[assignment]
-    ctrl = parsed["ctrl"]
-    shift = parsed["shift"]
-    alt = parsed["alt"]
-
-    modifier = 0
-    if shift:
-        modifier |= MODIFIERS["shift"]
-    if alt:
-        modifier |= MODIFIERS["alt"]
-    if ctrl:
-        modifier |= MODIFIERS["ctrl"]
+    if len(data) > _MATCH_CACHE_MAX_DATA_LEN:
+        return _matches_key_uncached(data, key_id)
 
-    # Escape
-    if key in ("escape", "esc"):
-        if modifier != 0:
-            return False
-        return data == "\x1b" or _matches_kitty_sequence(data, CODEPOINTS["escape"], 0)
+    cache_key = (data, key_id, _kitty_protocol_active)
+    result = _MATCH_CACHE.get(cache_key)
+    if result is None:
+        result = _matches_key_uncached(data, key_id)
+        if len(_MATCH_CACHE) >= _MATCH_CACHE_SIZE:
+            _MATCH_CACHE.clear()
+        _MATCH_CACHE[cache_key] = result
+    return result
 
-    # Space
-    if key == "space":
-        if not _kitty_protocol_active:
-            if ctrl and not alt and not shift and data == "\x00":
-                return True
-            if alt and not ctrl and not shift and data == "\x1b ":
-                return True
-        if modifier == 0:
-            return data == " " or _matches_kitty_sequence(data, CODEPOINTS["space"], 0)
-        return _matches_kitty_sequence(data, CODEPOINTS["space"], modifier)
-
-    # Tab
-    if key == "tab":
-        if shift and not ctrl and not alt:
-            return (
-                data == "\x1b[Z"
-                or _matches_kitty_sequence(data, CODEPOINTS["tab"], MODIFIERS["shift"])
-            )
-        if modifier == 0:
-            return data == "\t" or _matches_kitty_sequence(data, CODEPOINTS["tab"], 0)
-        return _matches_kitty_sequence(data, CODEPOINTS["tab"], modifier)
-
-    # Enter
-    if key in ("enter", "return"):
-        if shift and not ctrl and not alt:
-            if _matches_kitty_sequence(data, CODEPOINTS["enter"], MODIFIERS["shift"]):
-                return True
-            if _matches_kitty_sequence(data, CODEPOINTS["kp_enter"], MODIFIERS["shift"]):
-                return True
-            if _matches_modify_other_keys(data, CODEPOINTS["enter"], MODIFIERS["shift"]):
-                return True
-            if _kitty_protocol_active:
-                return data == "\x1b\r" or data == "\n"
-            return False
-        if alt and not ctrl and not shift:
-            if _matches_kitty_sequence(data, CODEPOINTS["enter"], MODIFIERS["alt"]):
-                return True
-            if _matches_kitty_sequence(data, CODEPOINTS["kp_enter"], MODIFIERS["alt"]):
-                return True
-            if _matches_modify_other_keys(data, CODEPOINTS["enter"], MODIFIERS["alt"]):
-                return True
-            if not _kitty_protocol_active:
-                return data == "\x1b\r"
-            return False
-        if modifier == 0:
-            return (
-                data == "\r"
-                or (not _kitty_protocol_active and data == "\n")
-                or data == "\x1bOM"
-                or _matches_kitty_sequence(data, CODEPOINTS["enter"], 0)
-                or _matches_kitty_sequence(data, CODEPOINTS["kp_enter"], 0)
-            )
-        return (
-            _matches_kitty_sequence(data, CODEPOINTS["enter"], modifier)
-            or _matches_kitty_sequence(data, CODEPOINTS["kp_enter"], modifier)
-        )
 
-    # Backspace
-    if key == "backspace":
-        if alt and not ctrl and not shift:
-            if data in ("\x1b\x7f", "\x1b\b"):
-                return True
-            return _matches_kitty_sequence(data, CODEPOINTS["backspace"], MODIFIERS["alt"])
-        if modifier == 0:
-            return (
-                data in ("\x7f", "\x08")
-                or _matches_kitty_sequence(data, CODEPOINTS["backspace"], 0)
-            )
-        return _matches_kitty_sequence(data, CODEPOINTS["backspace"], modifier)
-
-    # Functional keys (insert, delete, home, end, pageUp, pageDown)
-    functional_keys = ["insert", "delete", "home", "end", "pageup", "pagedown"]
-    if key in functional_keys:
-        key_map = {"pageup": "pageUp", "pagedown": "pageDown"}
-        legacy_key: str = key_map.get(key, key)  # type: ignore[arg-type]
-        legacy_sequences = LEGACY_KEY_SEQUENCES.get(legacy_key, [])
-        cp = FUNCTIONAL_CODEPOINTS.get(legacy_key)
-
-        if modifier == 0:
-            if _matches_legacy_sequence(data, legacy_sequences):
-                return True
-            return bool(cp and _matches_kitty_sequence(data, cp, 0))
-
-        if _matches_legacy_modifier_sequence(data, key, modifier):
-            return True
-        if cp:
-            return _matches_kitty_sequence(data, cp, modifier)
+def _matches_key_uncached(data: str, key_id: str) -> bool:
+    """Match input data against a key identifier without the result cache."""
+    parsed = _parse_key_id(key_id)
+    if parsed is None:
         return False
+    key, ctrl, shift, alt, modifier = parsed
 
-    # Arrow keys
-    arrow_keys = ["up", "down", "left", "right"]
-    if key in arrow_keys:
-        legacy_sequences = LEGACY_KEY_SEQUENCES.get(key, [])
-        cp = ARROW_CODEPOINTS[key]
-
-        # Alt variations
-        if alt and not ctrl and not shift:
-            if key == "up":
-                return data == "\x1bp" or _matches_kitty_sequence(data, cp, MODIFIERS["alt"])
-            if key == "down":
-                return data == "\x1bn" or _matches_kitty_sequence(data, cp, MODIFIERS["alt"])
-            if key == "left":
-                return (
-                    data == "\x1b[1;3D"
-                    or (not _kitty_protocol_active and data == "\x1bB")
-                    or data == "\x1bb"
-                    or _matches_kitty_sequence(data, cp, MODIFIERS["alt"])
-                )
-            if key == "right":
-                return (
-                    data == "\x1b[1;3C"
-                    or (not _kitty_protocol_active and data == "\x1bF")
-                    or data == "\x1bf"
-                    or _matches_kitty_sequence(data, cp, MODIFIERS["alt"])
-                )
-
-        # Ctrl variations
-        if ctrl and not alt and not shift and key == "left":
-            return (
-                data == "\x1b[1;5D"
-                or _matches_legacy_modifier_sequence(data, "left", MODIFIERS["ctrl"])
-                or _matches_kitty_sequence(data, cp, MODIFIERS["ctrl"])
-            )
-
-        if ctrl and not alt and not shift and key == "right":
-            return (
-                data == "\x1b[1;5C"
-                or _matches_legacy_modifier_sequence(data, "right", MODIFIERS["ctrl"])
-                or _matches_kitty_sequence(data, cp, MODIFIERS["ctrl"])
-            )
-
-        if modifier == 0:
-            return (
-                _matches_legacy_sequence(data, legacy_sequences)
-                or _matches_kitty_sequence(data, cp, 0)
-            )
-
-        if _matches_legacy_modifier_sequence(data, key, modifier):
-            return True
-        return _matches_kitty_sequence(data, cp, modifier)
-
-    # Function keys (F1-F12)
-    fn_key = key if key.startswith("f") and key[1:].isdigit() else None
-    if fn_key and fn_key in LEGACY_KEY_SEQUENCES:
-        legacy_sequences = LEGACY_KEY_SEQUENCES[fn_key]
-        if modifier == 0:
-            return _matches_legacy_sequence(data, legacy_sequences)
-        return False  # Function keys with modifiers not fully implemented
-
-    # Clear key
-    if key == "clear":
-        if modifier == 0:
-            return _matches_legacy_sequence(data, LEGACY_KEY_SEQUENCES.get("clear", []))
-        return _matches_legacy_modifier_sequence(data, "clear", modifier)
-
-    # Letter keys (a-z)
-    if len(key) == 1 and key.isalpha():
-        char_code = ord(key)
-
-        # Ctrl combinations
-        if ctrl and not alt and not shift:
-            ctrl_char = _raw_ctrl_char(key)
-            if ctrl_char and data == ctrl_char:
-                return True
-            return _matches_kitty_sequence(data, char_code, MODIFIERS["ctrl"])
-
-        # Alt combinations
-        if alt and not ctrl and not shift:
-            if data == f"\x1b{key}" or data == f"\x1b{key.upper()}":
-                return True
-            return _matches_kitty_sequence(data, char_code, MODIFIERS["alt"])
-
-        # No modifier
-        if modifier == 0:
-            return data == key or data == key.upper()
-
-        # Other combinations via Kitty protocol
-        return _matches_kitty_sequence(data, char_code, modifier)
-
-    # Symbol keys
-    if key in SYMBOL_KEYS:
-        char_code = ord(key)
-
-        if ctrl and not alt and not shift:
-            ctrl_char = _raw_ctrl_char(key)
-            if ctrl_char and data == ctrl_char:
-                return True
+    # A fixed legacy sequence names exactly one key id; when that is the one
+    # asked for there is nothing left to check. Aliases such as "return" for
+    # "enter" and Kitty forms still go through the matchers below.
+    if _LEGACY_SEQUENCE_KEYS.get(data) == parsed:
+        return True
 
-        if modifier == 0:
-            return data == key
+    matcher = _MATCHERS.get(key)
+    if matcher is None:
+        # Letters outside a-z (e.g. non-Latin layouts) are not in the table
+        if len(key) == 1 and key.isalpha():
+            matcher = _match_letter
+        else:
+            return False
+    return matcher(data, key, modifier, ctrl, shift, alt)
+
+
+def _ascii_key_id(code: int) -> str | None:
+    """Key identifier for a single ASCII character (used to build _ASCII_KEY_IDS)."""
+    char = chr(code)
+
+    # Control characters
+    if code < 32:
+        if code == 9:
+            return "tab"
+        if code == 13:
+            return "enter"
+        if code == 27:
+            return "escape"
+        if code == 8 or code == 127:
+            return "backspace"
+        # Ctrl+A to Ctrl+Z
+        if 1 <= code <= 26:
+            return f"ctrl+{chr(code + 96)}"
+
+    # Regular keys
+    if char.isalpha():
+        return char.lower()
+    if char in SYMBOL_KEYS:
+        return char
+    if char == " ":
+        return "space"
+    return None
 
-        return _matches_kitty_sequence(data, char_code, modifier)
 
-    return False
+# ASCII code -> key identifier reported by parse_key() for that one character
+_ASCII_KEY_IDS: tuple[str | None, ...] = tuple(_ascii_key_id(code) for code in range(128))
 
 
 def parse_key(data: str) -> str | None:
@@ -843,65 +998,20 @@ def parse_key(data: str) -> str | None:
     if data in LEGACY_SEQUENCE_KEY_IDS:
         return LEGACY_SEQUENCE_KEY_IDS[data]
 
-    # Single character keys
+    # Single character keys (nothing else can match one character)
     if len(data) == 1:
-        char = data
-        code = ord(char)
-
-        # Control characters
-        if code < 32:
-            if code == 9:
-                return "tab"
-            if code == 13:
-                return "enter"
-            if code == 27:
-                return "escape"
-            if code == 8 or code == 127:
-                return "backspace"
-            # Ctrl+A to Ctrl+Z
-            if 1 <= code <= 26:
-                return f"ctrl+{chr(code + 96)}"
-
-        # Regular keys
-        if char.isalpha():
-            return char.lower()
-        if char in SYMBOL_KEYS:
-            return char
-        if char == " ":
-            return "space"
+        code = ord(data)
+        if code < 128:
+            return _ASCII_KEY_IDS[code]
+        return data.lower() if data.isalpha() else None
 
     # Parse Kitty sequence
     parsed = _parse_kitty_sequence(data)
     if parsed:
-        cp = parsed["codepoint"]
-        mod = parsed["modifier"]
-
-        # Build key ID
-        key = None
-
-        # Check arrow keys
-        for name, code in ARROW_CODEPOINTS.items():
-            if cp == code:
-                key = name
-                break
-
-        # Check functional keys
-        if not key:
-            for name, code in FUNCTIONAL_CODEPOINTS.items():
-                if cp == code:
-                    key = name
-                    break
-
-        # Regular character
-        if not key and 32 <= cp <= 126:
-            key = chr(cp).lower()
-
-        # Function keys (F1-F12) from codepoints 57344+
-        if not key and cp >= 57344:
-            fn_num = cp - 57343  # F1 = 57344
-            if 1 <= fn_num <= 12:
-                key = f"f{fn_num}"
+        cp = parsed.codepoint
+        mod = parsed.modifier
 
+        key = _CODEPOINT_KEY_NAMES.get(cp)
         if key:
             modifiers = []
             if mod & MODIFIERS["shift"]:
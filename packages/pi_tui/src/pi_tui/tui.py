@@ -19,9 +19,10 @@ from typing import TYPE_CHECKING, Literal, TypedDict
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-    from pi_tui.component import Component
+    from pi_tui.component import Component, Focusable
     from pi_tui.terminal import Terminal
 
+from pi_tui.component import is_focusable
 from pi_tui.container import Container
 
 # =============================================================================
@@ -214,8 +215,6 @@ class TUI(Container):
 
         TypeScript Reference: _ts_reference/tui.ts:setFocus
         """
-        from pi_tui.component import Focusable, is_focusable
-
         # Clear focused flag on old component
         if self._focused_component is not None and is_focusable(self._focused_component):
             focusable: Focusable = self._focused_component  # type: ignore[assignment]
@@ -55,7 +55,10 @@ def visible_width(text: str) -> int:
         >>> visible_width("\x1b[31mHello\x1b[0m")
         5
     """
-    clean = _strip_ansi(text)
+    clean = _strip_ansi(text) if "\x1b" in text else text
+    # Printable ASCII is one column per character, no per-character lookup
+    if clean.isascii() and clean.isprintable():
+        return len(clean)
     return sum(max(0, wcwidth(c)) for c in clean)
 
 
@@ -88,9 +91,14 @@ def truncate_to_width(
             return text + (" " * (max_width - total_width))
         return text
 
+    ellipsis_width = visible_width(ellipsis)
+
+    # Plain printable ASCII: every character is one column, so cut by index
+    if text.isascii() and text.isprintable():
+        return text[: max(0, max_width - ellipsis_width)] + ellipsis
+
     current_width = 0
     result = []
-    ellipsis_width = visible_width(ellipsis)
 
     # If max_width is smaller than ellipsis, we can't really show ellipsis properly
     # but we'll follow the logic of showing it if possible.
@@ -248,6 +248,7 @@ class MockComponent:
         self.render_calls: list[int] = []
         self.input_calls: list[str] = []
         self.invalidate_calls = 0
+        self.clean = False
         self.wants_key_release = False
 
     def render(self, width: int) -> list[str]:
@@ -260,6 +261,9 @@ class MockComponent:
     def invalidate(self) -> None:
         self.invalidate_calls += 1
 
+    def is_clean(self, width: int) -> bool:
+        return self.clean
+
 
 class MockFocusableComponent(MockComponent):
     """Mock component that implements Focusable protocol."""
@@ -245,3 +245,133 @@ def test_cache_invalidated_on_remove_child(mock_component_factory):
 
     box.remove_child(c1)
     assert box.render(10) == []
+
+def test_styled_lines_reused_when_children_change(mock_component_factory):
+    """Unchanged lines are not restyled when another child changes."""
+    bg_fn = MagicMock(side_effect=lambda s: s)
+    box = Box(padding_x=0, padding_y=0, bg_fn=bg_fn)
+    c1 = mock_component_factory(["same"])
+    c2 = mock_component_factory(["old"])
+    box.add_child(c1)
+    box.add_child(c2)
+    box.render(10)
+    bg_fn.reset_mock()
+
+    c2._render_output = ["new"]
+    assert box.render(10) == ["same      ", "new       "]
+    # bg_sample("test") plus restyling "new" only
+    assert [call.args[0] for call in bg_fn.call_args_list] == ["test", "new       "]
+
+def test_styled_lines_dropped_when_bg_output_changes(mock_component_factory):
+    """A bg function whose output changes does not serve stale lines."""
+    color = ["red"]
+    box = Box(padding_x=0, padding_y=0, bg_fn=lambda s: f"{color[0]}({s})")
+    child = mock_component_factory(["hi"])
+    box.add_child(child)
+    assert box.render(4) == ["red(hi  )"]
+
+    color[0] = "blue"
+    assert box.render(4) == ["blue(hi  )"]
+
+def test_repeated_invalidate_propagates_once(mock_component_factory):
+    """Invalidating again before the next render skips the children."""
+    child = mock_component_factory(["hello"])
+    box = Box(padding_x=0, padding_y=0)
+    box.add_child(child)
+    box.render(10)
+
+    box.invalidate()
+    box.invalidate()
+    assert child.invalidate_calls == 1
+
+    box.render(10)
+    box.invalidate()
+    assert child.invalidate_calls == 2
+
+def test_clean_children_are_not_rendered(mock_component_factory):
+    """Unchanged width and clean children reuse the cached lines."""
+    child = mock_component_factory(["hello"])
+    box = Box(padding_x=1, padding_y=0)
+    box.add_child(child)
+    first = box.render(10)
+
+    child.clean = True
+    assert box.is_clean(10)
+    assert box.render(10) is first
+    assert child.render_calls == [8]
+
+    assert not box.is_clean(12)
+    box.render(12)
+    assert child.render_calls == [8, 10]
+
+def test_dirty_child_is_rendered(mock_component_factory):
+    """A single child that is not clean forces a full render."""
+    clean = mock_component_factory(["a"])
+    dirty = mock_component_factory(["b"])
+    clean.clean = True
+    box = Box(padding_x=0, padding_y=0)
+    box.add_child(clean)
+    box.add_child(dirty)
+    box.render(5)
+    box.render(5)
+    assert len(clean.render_calls) == 2
+    assert len(dirty.render_calls) == 2
+
+def test_clean_text_child_skips_render():
+    """Text reports clean until its text changes."""
+    from pi_tui.components.text import Text
+
+    text = Text("Hello", padding_x=0, padding_y=0)
+    box = Box(padding_x=0, padding_y=0)
+    box.add_child(text)
+    first = box.render(10)
+    assert box.render(10) is first
+
+    text.set_text("World")
+    assert not box.is_clean(10)
+    assert box.render(10) == ["World     "]
+
+def test_child_without_is_clean_renders_again():
+    """Children without their own clean tracking are rendered every time."""
+
+    class Plain:
+        def render(self, width: int) -> list[str]:
+            return ["plain"]
+
+        def invalidate(self) -> None:
+            pass
+
+    box = Box(padding_x=0, padding_y=0)
+    box.add_child(Plain())
+    assert box.render(10) == ["plain     "]
+    assert box.render(10) == ["plain     "]
+
+def test_directly_appended_child_is_rendered():
+    """Mutating the public children list bypasses the cached output."""
+    from pi_tui.components.text import Text
+
+    box = Box(padding_x=0, padding_y=0)
+    box.add_child(Text("a", padding_x=0, padding_y=0))
+    assert box.render(5) == ["a    "]
+
+    appended = Text("b", padding_x=0, padding_y=0)
+    appended.render(5)
+    box.children.append(appended)
+    assert not box.is_clean(5)
+    assert box.render(5) == ["a    ", "b    "]
+
+def test_padded_child_lines_are_interned(mock_component_factory):
+    """Short padded lines are shared across renders; long ones are not interned."""
+    long_line = "x" * 300
+    child = mock_component_factory(["hello", long_line])
+    box = Box(padding_x=1, padding_y=0)
+    box.add_child(child)
+    box.render(400)
+    first = box._cache.child_lines
+    box.invalidate()
+    box.render(400)
+    second = box._cache.child_lines
+
+    assert second[0] is first[0]
+    assert second[1] == first[1]
+    assert second[1] is not first[1]
@@ -207,3 +207,15 @@ def test_is_focusable_returns_false_for_list():
 def test_is_focusable_returns_false_for_dict():
     """Test returns False for a dict."""
     assert is_focusable({}) is False  # type: ignore
+
+
+def test_package_exports_resolve_lazily():
+    """Every name in pi_tui.__all__ resolves through the lazy loader."""
+    import pi_tui
+    from pi_tui.components.box import Box
+
+    for name in pi_tui.__all__:
+        assert getattr(pi_tui, name) is not None
+    assert pi_tui.Box is Box
+    with pytest.raises(AttributeError):
+        pi_tui.NotAnExport  # noqa: B018
@@ -147,3 +147,95 @@ class TestContainer:
         width = 123
         container.render(width)
         assert mock_component.render_calls == [width]
+
+    # =========================================================================
+    # D. Render Cache Tests
+    # =========================================================================
+
+    def test_clean_child_output_is_reused(self, mock_component_factory):
+        container = Container()
+        child = mock_component_factory(["a"])
+        container.add_child(child)
+        container.render(80)
+        child.clean = True
+        assert container.render(80) == ["a"]
+        assert child.render_calls == [80]
+
+    def test_dirty_child_is_rendered_again(self, mock_component_factory):
+        container = Container()
+        child = mock_component_factory(["a"])
+        container.add_child(child)
+        container.render(80)
+        container.render(80)
+        assert child.render_calls == [80, 80]
+
+    def test_width_change_renders_clean_child(self, mock_component_factory):
+        container = Container()
+        child = mock_component_factory(["a"])
+        container.add_child(child)
+        container.render(80)
+        child.clean = True
+        container.render(40)
+        assert child.render_calls == [80, 40]
+
+    def test_new_child_in_slot_is_rendered(self, mock_component_factory):
+        container = Container()
+        first = mock_component_factory(["a"])
+        second = mock_component_factory(["b"])
+        second.clean = True
+        container.add_child(first)
+        container.render(80)
+        container.children[0] = second
+        assert container.render(80) == ["b"]
+
+    def test_invalidate_drops_cached_output(self, mock_component_factory):
+        container = Container()
+        child = mock_component_factory(["a"])
+        container.add_child(child)
+        container.render(80)
+        child.clean = True
+        container.invalidate()
+        container.render(80)
+        assert child.render_calls == [80, 80]
+
+    def test_nested_container_renders_again(self, mock_component_factory):
+        outer = Container()
+        inner = Container()
+        child = mock_component_factory(["a"])
+        inner.add_child(child)
+        outer.add_child(inner)
+        assert outer.render(80) == ["a"]
+        assert outer.render(80) == ["a"]
+        assert child.render_calls == [80, 80]
+
+    def test_nested_container_with_clean_children_is_reused(self, mock_component_factory):
+        outer = Container()
+        inner = Container()
+        child = mock_component_factory(["a"])
+        inner.add_child(child)
+        outer.add_child(inner)
+        outer.render(80)
+        child.clean = True
+        assert inner.is_clean(80)
+        assert outer.render(80) == ["a"]
+        assert child.render_calls == [80]
+
+    def test_duck_typed_child_is_always_rendered(self):
+        class Plain:
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def render(self, width: int) -> list[str]:
+                self.calls += 1
+                return ["plain"]
+
+            def invalidate(self) -> None:
+                pass
+
+        container = Container()
+        child = Plain()
+        container.add_child(child)
+        assert container.render(80) == ["plain"]
+        assert container.render(80) == ["plain"]
+        assert child.calls == 2
+        assert not container.is_clean(80)
@@ -0,0 +1,158 @@
+"""Tests for the Input component."""
+
+from pi_tui.components.input import Input
+
+LEFT = "\x1b[D"
+RIGHT = "\x1b[C"
+BACKSPACE = "\x7f"
+DELETE = "\x1b[3~"
+CTRL_A = "\x01"
+CTRL_E = "\x05"
+CTRL_K = "\x0b"
+CTRL_U = "\x15"
+CTRL_W = "\x17"
+CTRL_Z = "\x1a"
+PASTE_START = "\x1b[200~"
+PASTE_END = "\x1b[201~"
+
+
+def _type(inp: Input, *keys: str) -> None:
+    for key in keys:
+        inp.handle_input(key)
+
+
+def _value_with_cursor(inp: Input) -> str:
+    """Return the value with a ``|`` inserted at the cursor position."""
+    inp.handle_input("|")
+    value = inp.get_value()
+    inp.handle_input(CTRL_Z)
+    return value
+
+
+def test_cursor_starts_at_end_of_initial_value():
+    inp = Input("abc")
+    assert _value_with_cursor(inp) == "abc|"
+
+
+def test_insert_after_moving_left():
+    inp = Input("hello")
+    _type(inp, LEFT, LEFT, "X")
+    assert inp.get_value() == "helXlo"
+    assert _value_with_cursor(inp) == "helX|lo"
+
+
+def test_moves_across_gap_and_edits_at_both_ends():
+    inp = Input("hello")
+    _type(inp, CTRL_A, "S", CTRL_E, "E")
+    assert inp.get_value() == "ShelloE"
+    _type(inp, LEFT, LEFT, LEFT, RIGHT, "-")
+    assert inp.get_value() == "Shell-oE"
+
+
+def test_cursor_movement_is_clamped():
+    inp = Input("ab")
+    _type(inp, RIGHT, RIGHT)
+    assert _value_with_cursor(inp) == "ab|"
+    _type(inp, LEFT, LEFT, LEFT, LEFT)
+    assert _value_with_cursor(inp) == "|ab"
+
+
+def test_backspace_and_delete_in_middle():
+    inp = Input("abcd")
+    _type(inp, LEFT, LEFT, BACKSPACE)
+    assert inp.get_value() == "acd"
+    _type(inp, DELETE)
+    assert inp.get_value() == "ad"
+    assert _value_with_cursor(inp) == "a|d"
+
+
+def test_backspace_at_start_and_delete_at_end_are_noops():
+    inp = Input("ab")
+    _type(inp, DELETE)
+    assert inp.get_value() == "ab"
+    _type(inp, CTRL_A, BACKSPACE)
+    assert inp.get_value() == "ab"
+
+
+def test_ctrl_k_deletes_to_end():
+    inp = Input("hello world")
+    _type(inp, CTRL_A, RIGHT, RIGHT, CTRL_K)
+    assert inp.get_value() == "he"
+
+
+def test_undo_insert_restores_value_and_cursor():
+    inp = Input("ac")
+    _type(inp, LEFT, "b")
+    assert inp.get_value() == "abc"
+    _type(inp, CTRL_Z)
+    assert inp.get_value() == "ac"
+    assert _value_with_cursor(inp) == "a|c"
+
+
+def test_undo_backspace_restores_value_and_cursor():
+    inp = Input("abc")
+    _type(inp, LEFT, BACKSPACE)
+    assert inp.get_value() == "ac"
+    _type(inp, CTRL_Z)
+    assert inp.get_value() == "abc"
+    assert _value_with_cursor(inp) == "ab|c"
+
+
+def test_undo_ctrl_w_restores_value_and_cursor():
+    inp = Input("foo bar")
+    _type(inp, CTRL_W)
+    assert inp.get_value() == "foo "
+    _type(inp, CTRL_Z)
+    assert inp.get_value() == "foo bar"
+    assert _value_with_cursor(inp) == "foo bar|"
+
+
+def test_undo_ctrl_u_restores_value_and_cursor():
+    inp = Input("hello world")
+    _type(inp, CTRL_A, *[RIGHT] * 5, CTRL_U)
+    assert inp.get_value() == " world"
+    assert _value_with_cursor(inp) == "| world"
+    _type(inp, CTRL_Z)
+    assert inp.get_value() == "hello world"
+    assert _value_with_cursor(inp) == "hello| world"
+
+
+def test_undo_with_empty_history_is_noop():
+    inp = Input("abc")
+    _type(inp, CTRL_Z)
+    assert inp.get_value() == "abc"
+
+
+def test_undo_history_is_capped():
+    inp = Input()
+    _type(inp, *["x"] * 300)
+    _type(inp, *[CTRL_Z] * 300)
+    assert inp.get_value() == "x" * 44
+
+
+def test_set_value_clears_undo_history():
+    inp = Input()
+    _type(inp, "a", "b")
+    inp.set_value("xyz")
+    _type(inp, CTRL_Z)
+    assert inp.get_value() == "xyz"
+
+
+def test_paste_inserts_text_without_newlines():
+    inp = Input("[]")
+    _type(inp, LEFT, f"{PASTE_START}one\r\ntwo{PASTE_END}")
+    assert inp.get_value() == "[onetwo]"
+
+
+def test_paste_end_marker_split_across_calls():
+    inp = Input()
+    _type(inp, f"{PASTE_START}hel", f"lo{PASTE_END[:3]}", f"{PASTE_END[3:]}X")
+    assert inp.get_value() == "helloX"
+
+
+def test_keys_after_paste_end_are_handled():
+    inp = Input()
+    _type(inp, f"{PASTE_START}abc{PASTE_END}{BACKSPACE}")
+    assert inp.get_value() == "ab"
+    _type(inp, f"{PASTE_START}z{PASTE_END}{CTRL_A}")
+    assert _value_with_cursor(inp) == "|abz"
@@ -130,6 +130,23 @@ class TestLegacySequenceMatching:
     def test_navigation_keys(self, data, key_id, reset_kitty_protocol):
         assert matches_key(data, key_id) is True
 
+    @pytest.mark.parametrize("data,key_id", [
+        ("\x1b[5$", "shift+pageUp"),
+        ("\x1b[6$", "shift+pageDown"),
+        ("\x1b[5^", "ctrl+pageUp"),
+        ("\x1b[6^", "ctrl+pageDown"),
+        ("\x1b[3$", "shift+delete"),
+        ("\x1b[7^", "ctrl+home"),
+    ])
+    def test_modified_navigation_keys(self, data, key_id, reset_kitty_protocol):
+        assert matches_key(data, key_id) is True
+        assert parse_key(data) == key_id
+
+    def test_legacy_sequence_alias(self, reset_kitty_protocol):
+        assert matches_key("\x1bOM", "enter") is True
+        assert matches_key("\x1bOM", "return") is True
+        assert matches_key("\x1b[A", "down") is False
+
     def test_shift_tab(self, reset_kitty_protocol):
         assert matches_key("\x1b[Z", "shift+tab") is True
 
@@ -197,6 +214,28 @@ class TestMatchesKeyEdgeCases:
     def test_wrong_key(self, reset_kitty_protocol):
         assert matches_key("a", "b") is False
 
+    def test_cached_result_follows_protocol_state(self, reset_kitty_protocol):
+        # Newline is Enter only while the Kitty protocol is off
+        assert matches_key("\n", "enter") is True
+        set_kitty_protocol_active(True)
+        assert matches_key("\n", "enter") is False
+        set_kitty_protocol_active(False)
+        assert matches_key("\n", "enter") is True
+
+    def test_long_input_is_not_cached(self, reset_kitty_protocol):
+        from pi_tui import keys
+
+        paste = "\x1b[200~" + "x" * 100 + "\x1b[201~"
+        assert matches_key(paste, "escape") is False
+        assert not any(k[0] == paste for k in keys._MATCH_CACHE)
+
+    def test_plain_text_is_rejected_without_caching(self, reset_kitty_protocol):
+        from pi_tui import keys
+
+        assert matches_key("hello", "h") is False
+        assert matches_key("SS", "\u00df") is True  # Uppercase of sharp s
+        assert not any(k[0] == "hello" for k in keys._MATCH_CACHE)
+
 
 class TestParseKey:
     """Tests for parse_key function."""
@@ -181,3 +181,37 @@ def test_render_with_bg_fn_and_padding_x():
     # then calls bg_fn(" Hi   ") -> "BG( Hi   )"
     rendered = text.render(6)
     assert rendered == ["BG( Hi   )"]
+
+def test_is_clean_tracks_cache():
+    """is_clean() holds only while the cached lines match text and width."""
+    text = Text("Hello", padding_x=0, padding_y=0)
+    assert not text.is_clean(10)
+    text.render(10)
+    assert text.is_clean(10)
+    assert not text.is_clean(20)
+    text.set_text("World")
+    assert not text.is_clean(10)
+
+def test_cache_keeps_recent_widths():
+    """Resizing back to an earlier width reuses its rendered lines."""
+    text = Text("Hello", padding_x=0, padding_y=0)
+    rendered1 = text.render(10)
+    text.render(20)
+    assert text.render(10) is rendered1
+
+def test_cache_keyed_on_bg_fn():
+    """Switching the bg function back reuses the earlier lines."""
+    text = Text("Hello", padding_x=0, padding_y=0)
+    rendered1 = text.render(10)
+    text.set_custom_bg_fn(lambda x: f"[{x}]")
+    assert text.render(10) == ["[Hello     ]"]
+    text.set_custom_bg_fn(None)
+    assert text.render(10) is rendered1
+
+def test_cache_evicts_least_recently_used():
+    """Only the most recent few renders stay cached."""
+    text = Text("Hello", padding_x=0, padding_y=0)
+    rendered1 = text.render(10)
+    for width in range(11, 20):
+        text.render(width)
+    assert text.render(10) is not rendered1